@@ -48,7 +48,22 @@ class TestCircuit(unittest.TestCase):
         self.circuit.remove_component(r1)
         self.assertNotIn(r1, self.circuit.components)
         self.assertEqual(len(self.circuit.components), 0)
-    
+
+    def test_find_terminal_owner(self):
+        """Test that terminal owners are found and the index follows added/removed components."""
+        r1 = Resistor(resistance=1000)
+        r2 = Resistor(resistance=2000)
+
+        self.circuit.add_component(r1)
+        self.assertIs(self.circuit._find_terminal_owner(r1.n2), r1)
+        self.assertIsNone(self.circuit._find_terminal_owner(r2.n1))
+
+        # Adding and removing components refreshes the cached index
+        self.circuit.add_component(r2)
+        self.assertIs(self.circuit._find_terminal_owner(r2.n1), r2)
+        self.circuit.remove_component(r1)
+        self.assertIsNone(self.circuit._find_terminal_owner(r1.n1))
+
     def test_wire_method_basic(self):
         """Test basic wire() method functionality."""
         vs = VoltageSource(voltage=5.0)
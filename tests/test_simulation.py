@@ -7,12 +7,18 @@ simulation backends, analysis types, and simulation integration.
 import unittest
 import os
 import sys
+import tempfile
+import threading
+from unittest import mock
+import numpy as np
 
 # Add the parent directory to the path to import zest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from zest import Circuit, VoltageSource, Resistor, Capacitor, Inductor
-from zest.simulation import CircuitSimulator, SimulatedCircuit, check_simulation_requirements, SpicelibBackend
+from zest.simulation import CircuitSimulator, SimulatedCircuit, check_simulation_requirements, SpicelibBackend, SimulationFailure
+from zest.simulation import SweepRunner, _overlay_netlist, _scratch_root
+from zest.rawfile import LazyRawRead
 from .golden_test_framework import GoldenTestMixin
 
 
@@ -79,6 +85,128 @@ class TestSimulatorBackend(unittest.TestCase):
         backend = SpicelibBackend()
         self.assertIsNotNone(backend)
     
+    def test_backends_share_runner(self):
+        """Test that all backend instances reuse one SimRunner."""
+        self.assertIs(SpicelibBackend()._get_runner(), SpicelibBackend()._get_runner())
+    
+    def test_backend_result_cache(self):
+        """Test that identical netlists are served from ZEST_SIM_CACHE without simulating."""
+        netlist = self.circuit.compile_to_spice()
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(os.environ, {'ZEST_SIM_CACHE': cache_dir}):
+            first = SpicelibBackend().run(netlist, analyses=["op"], circuit=self.circuit)
+            self.assertEqual(len([f for f in os.listdir(cache_dir) if f.endswith('.raw')]), 1)
+
+            # A cache hit must not reach the simulator at all
+            with mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+                second = SpicelibBackend().run(netlist, analyses=["op"], circuit=self.circuit)
+
+        self.assertAlmostEqual(second.get_node_voltage(self.vs.pos)[0], first.get_node_voltage(self.vs.pos)[0])
+
+    def test_store_in_cache_concurrent(self):
+        """Test that concurrent stores of the same key leave one complete file and no staging files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            raw_file = os.path.join(temp_dir, 'result.raw')
+            with open(raw_file, 'wb') as f:
+                f.write(b'x' * 100000)
+            cache_file = os.path.join(temp_dir, 'cache', 'key.raw')
+
+            threads = [
+                threading.Thread(target=SpicelibBackend._store_in_cache, args=(raw_file, cache_file))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(os.listdir(os.path.dirname(cache_file)), ['key.raw'])
+            with open(cache_file, 'rb') as f:
+                self.assertEqual(f.read(), b'x' * 100000)
+
+    def test_backend_result_cache_dir(self):
+        """Test that a backend's cache_dir enables the persistent cache without the environment variable."""
+        netlist = self.circuit.compile_to_spice()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            SpicelibBackend(cache_dir=cache_dir).run(netlist, analyses=["op"], circuit=self.circuit)
+            self.assertEqual(len([f for f in os.listdir(cache_dir) if f.endswith('.raw')]), 1)
+
+            with mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+                cached = SpicelibBackend(cache_dir=cache_dir).run(netlist, analyses=["op"], circuit=self.circuit)
+
+            if isinstance(cached.raw_data, LazyRawRead):
+                # Traces of a cached result are read from the cache file on first use
+                self.assertEqual(sorted(cached.raw_data._columns), [0])
+            self.assertAlmostEqual(cached.get_node_voltage(self.vs.pos), 12.0, places=6)
+
+    def test_backend_result_cache_skipped_when_keeping_files(self):
+        """Test that cleanup="keep" runs the simulation even when the result is cached."""
+        netlist = self.circuit.compile_to_spice()
+
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as keep_folder:
+            backend = SpicelibBackend(keep_folder=keep_folder, cache_dir=cache_dir)
+            backend.run(netlist, analyses=["op"], circuit=self.circuit)
+
+            result = backend.run(netlist, analyses=["op"], circuit=self.circuit, cleanup="keep")
+
+            self.assertTrue(any(name.endswith('.raw') for name in os.listdir(keep_folder)))
+        self.assertAlmostEqual(result.get_node_voltage(self.vs.pos), 12.0, places=6)
+
+    def test_scratch_root_skips_small_dev_shm(self):
+        """Test that run folders move off /dev/shm when it has little free space."""
+        environ = {key: value for key, value in os.environ.items() if key != 'ZEST_SIM_TMP'}
+        small = mock.Mock(free=64 * 1024 * 1024)
+
+        with mock.patch.dict(os.environ, environ, clear=True), \
+                mock.patch('zest.simulation.shutil.disk_usage', return_value=small):
+            self.assertIsNone(_scratch_root())
+        with mock.patch.dict(os.environ, {'ZEST_SIM_TMP': '/some/dir'}), \
+                mock.patch('zest.simulation.shutil.disk_usage', return_value=small):
+            self.assertEqual(_scratch_root(), '/some/dir')
+
+    def test_backend_memory_result_cache(self):
+        """Test that a backend serves repeated netlists from its in-memory LRU cache."""
+        backend = SpicelibBackend(result_cache_size=1)
+        netlist = self.circuit.compile_to_spice()
+        other_netlist = netlist.replace("DC 12.0", "DC 6.0")
+
+        first = backend.run(netlist, analyses=["op"], circuit=self.circuit)
+        with mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+            second = backend.run(netlist, analyses=["op"], circuit=self.circuit)
+        self.assertIsNot(second, first)
+        self.assertAlmostEqual(second.get_node_voltage(self.vs.pos), 12.0, places=6)
+
+        # Simulating another netlist evicts the first one
+        backend.run(other_netlist, analyses=["op"], circuit=self.circuit)
+        with mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+            with self.assertRaises(SimulationFailure):
+                backend.run(netlist, analyses=["op"], circuit=self.circuit)
+
+    def test_backend_memory_result_cache_off_by_default(self):
+        """Test that a default backend doesn't snapshot its results."""
+        backend = SpicelibBackend()
+
+        backend.run(self.circuit.compile_to_spice(), analyses=["op"], circuit=self.circuit)
+
+        self.assertEqual(len(backend._result_cache), 0)
+
+    def test_backend_memory_result_cache_isolated(self):
+        """Test that modifying a result in place doesn't change later cache hits."""
+        backend = SpicelibBackend(result_cache_size=4)
+        netlist = self.circuit.compile_to_spice()
+
+        first = backend.run(netlist, ["transient"], circuit=self.circuit, step_time=1e-5, end_time=1e-4)
+        first.get_node_voltage(self.vs.pos)[:] -= 10.0
+
+        with mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+            second = backend.run(netlist, ["transient"], circuit=self.circuit, step_time=1e-5, end_time=1e-4)
+            second.get_node_voltage(self.vs.pos)[:] -= 10.0
+            third = backend.run(netlist, ["transient"], circuit=self.circuit, step_time=1e-5, end_time=1e-4)
+
+        np.testing.assert_allclose(third.get_node_voltage(self.vs.pos)[1:], 12.0)
+
     def test_backend_operating_point(self):
         """Test backend operating point analysis."""
         backend = SpicelibBackend()
@@ -135,6 +263,159 @@ class TestSimulatorBackend(unittest.TestCase):
         )
         self.assertEqual(result.analysis_type, "DC Sweep")
         self.assertIsNotNone(result)
+    
+    def test_analysis_commands_replace_trailing_end(self):
+        """Test that analysis commands are inserted before a single trailing .end."""
+        backend = SpicelibBackend()
+        netlist = "* Circuit: Test\nR1 N1 gnd 1000\n.model aged\n.end\n"
+        
+        modified = backend._add_analysis_commands(netlist, ["op"])
+        
+        # Only the .end line is replaced - the preceding line keeps its trailing characters
+        self.assertEqual(modified, "* Circuit: Test\nR1 N1 gnd 1000\n.model aged\n.op\n.end\n")
+
+    def test_backend_op_sweep(self):
+        """Test that an operating point is solved for every overlay, in order."""
+        backend = SpicelibBackend()
+        netlist = self.circuit.compile_to_spice()
+
+        results = backend.run_op_sweep(netlist, [{"V1": 3.0}, {"V1": 6.0}], circuit=self.circuit)
+
+        self.assertEqual(len(results), 2)
+        for result, expected in zip(results, [3.0, 6.0]):
+            self.assertEqual(result.analysis_type, "DC Operating Point")
+            self.assertAlmostEqual(result._extract_value(result._get_node_voltage_value("N1")), expected, places=6)
+
+    def test_backend_op_sweep_passes_dtype_and_traces(self):
+        """Test that op sweep results honour the dtype and trace selection, as run() does."""
+        backend = SpicelibBackend(dtype=np.float32)
+        netlist = self.circuit.compile_to_spice()
+
+        results = backend.run_op_sweep(netlist, [{"V1": 3.0}], circuit=self.circuit, traces=["V(N1)"])
+
+        self.assertEqual(len(results[0].branches), 0)
+        self.assertEqual(results[0].get_node_voltage(self.vs.pos).dtype, np.float32)
+
+    def test_backend_op_sweep_shared_library(self):
+        """Test the op sweep through NGspice's shared library."""
+        netlist = self.circuit.compile_to_spice()
+        if not SweepRunner(netlist).available:
+            self.skipTest("NGspice shared library (PySpice) not available")
+
+        results = SweepRunner(netlist, circuit=self.circuit).run([{"V1": 3.0}, {"V1": 6.0}])
+
+        self.assertEqual(len(results), 2)
+        for result, expected in zip(results, [3.0, 6.0]):
+            self.assertIs(result.circuit, self.circuit)
+            self.assertEqual(result.analysis_type, "DC Operating Point")
+            self.assertAlmostEqual(result.get_node_voltage(self.vs.pos), expected, places=6)
+
+    def test_overlay_netlist_replaces_only_the_value(self):
+        """Test that overlays keep AC specs, transient sources and parameters of the element line."""
+        netlist = ("* Circuit: Overlay\n"
+                   "V1 N1 gnd DC 5 AC 1\n"
+                   "V2 N2 gnd PULSE(0 5 1n 1n)\n"
+                   "I1 N1 gnd 1m\n"
+                   "C1 N1 N2 1u IC=2\n"
+                   ".end")
+
+        overlaid = _overlay_netlist(netlist, {"V1": 3.3, "v2": 1, "I1": "2m", "C1": "2u"})
+
+        self.assertEqual(overlaid.splitlines()[1:5], [
+            "V1 N1 gnd DC 3.3 AC 1",
+            "V2 N2 gnd DC 1 PULSE(0 5 1n 1n)",
+            "I1 N1 gnd 2m",
+            "C1 N1 N2 2u IC=2",
+        ])
+
+    def test_backend_run_batch(self):
+        """Test that a batch of netlists is simulated in worker processes, in order."""
+        backend = SpicelibBackend()
+        netlist = self.circuit.compile_to_spice()
+        netlists = [netlist.replace("V1 N1 gnd DC 12.0", f"V1 N1 gnd DC {voltage}") for voltage in (2.0, 4.0, 8.0)]
+
+        results = backend.run_batch(netlists, ["op"], max_workers=2, circuit=self.circuit)
+
+        self.assertEqual(len(results), 3)
+        for result, expected in zip(results, [2.0, 4.0, 8.0]):
+            self.assertIs(result.circuit, self.circuit)
+            self.assertEqual(result.analysis_type, "DC Operating Point")
+            self.assertAlmostEqual(result._extract_value(result._get_node_voltage_value("N1")), expected, places=6)
+
+    def test_backend_run_batch_uses_backend_caches(self):
+        """Test that batch workers use the backend's cache_dir and repeated batches hit its memory cache."""
+        netlist = self.circuit.compile_to_spice()
+        netlists = [netlist.replace("DC 12.0", f"DC {voltage}") for voltage in (2.0, 4.0)]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            backend = SpicelibBackend(cache_dir=cache_dir, result_cache_size=4)
+            backend.run_batch(netlists, ["op"], circuit=self.circuit)
+            self.assertEqual(len([f for f in os.listdir(cache_dir) if f.endswith('.raw')]), 2)
+
+            with mock.patch('zest.simulation.ProcessPoolExecutor', side_effect=AssertionError("simulated")), \
+                    mock.patch.object(SpicelibBackend, '_get_runner', side_effect=AssertionError("simulated")):
+                results = backend.run_batch(netlists, ["op"], circuit=self.circuit)
+
+        for result, expected in zip(results, [2.0, 4.0]):
+            self.assertAlmostEqual(result.get_node_voltage(self.vs.pos), expected, places=6)
+
+    def test_backend_run_batch_keep_folder(self):
+        """Test that batch workers keep their files in the backend's keep folder."""
+        netlist = self.circuit.compile_to_spice()
+        netlists = [netlist.replace("DC 12.0", f"DC {voltage}") for voltage in (2.0, 4.0)]
+
+        with tempfile.TemporaryDirectory() as keep_folder:
+            SpicelibBackend(keep_folder=keep_folder).run_batch(netlists, ["op"], cleanup="keep")
+            kept_netlists = [name for name in os.listdir(keep_folder) if name.endswith('.net')]
+
+        self.assertGreaterEqual(len(kept_netlists), 2)
+
+    def test_backend_selected_traces(self):
+        """Test that only the requested traces (and the sweep axis) are loaded."""
+        backend = SpicelibBackend()
+        netlist = self.circuit.compile_to_spice()
+
+        result = backend.run(netlist, ["transient"], circuit=self.circuit,
+                             step_time=1e-5, end_time=1e-4, traces=["V(N1)"])
+
+        self.assertEqual([name.lower() for name in result.trace_names], ["time", "v(n1)"])
+        if isinstance(result.raw_data, LazyRawRead):
+            # Only the axis and the requested trace were read from the binary file
+            self.assertEqual(sorted(result.raw_data._columns), [0, 1])
+        self.assertEqual(len(result.branches), 0)
+        self.assertAlmostEqual(float(result._get_node_voltage_value("N1")[-1]), 12.0, places=6)
+
+    def test_backend_keep_folder(self):
+        """Test that cleanup="keep" writes into the folder given to the backend."""
+        with tempfile.TemporaryDirectory() as keep_folder:
+            backend = SpicelibBackend(keep_folder=keep_folder)
+            result = backend.run(self.circuit.compile_to_spice(), ["op"], circuit=self.circuit, cleanup="keep")
+
+            self.assertEqual(result.analysis_type, "DC Operating Point")
+            kept_extensions = {os.path.splitext(name)[1] for name in os.listdir(keep_folder)}
+            self.assertTrue({'.net', '.raw'} <= kept_extensions)
+
+    def test_backend_default_dtype(self):
+        """Test that a backend's dtype applies unless run() is given one."""
+        backend = SpicelibBackend(dtype=np.float32)
+        netlist = self.circuit.compile_to_spice()
+
+        result = backend.run(netlist, ["transient"], circuit=self.circuit, step_time=1e-5, end_time=1e-4)
+        self.assertEqual(result.get_node_voltage(self.vs.pos).dtype, np.float32)
+
+        result = backend.run(netlist, ["transient"], circuit=self.circuit, step_time=1e-5, end_time=1e-4,
+                             dtype=np.float64)
+        self.assertEqual(result.get_node_voltage(self.vs.pos).dtype, np.float64)
+
+    def test_backend_op_sweep_invalid_overlays(self):
+        """Test that overlays naming different or unknown elements are rejected."""
+        backend = SpicelibBackend()
+        netlist = self.circuit.compile_to_spice()
+
+        with self.assertRaises(ValueError):
+            backend.run_op_sweep(netlist, [{"V1": 3.0}, {"R1": 500}])
+        with self.assertRaises(ValueError):
+            backend.run_op_sweep(netlist, [{"R9": 500}])
 
 
 class TestCircuitIntegrationMethods(unittest.TestCase):
@@ -313,6 +594,273 @@ class TestSimulatedCircuit(unittest.TestCase):
             pass  # DC sweep might not be available
 
 
+class _StubRawData:
+    """Minimal stand-in for spicelib raw data that records trace reads."""
+    
+    def __init__(self, traces):
+        self.traces = traces
+        self.reads = []
+    
+    def get_trace_names(self):
+        return list(self.traces)
+    
+    def get_wave(self, trace_name):
+        self.reads.append(trace_name)
+        return self.traces[trace_name]
+
+
+class TestSimulatedCircuitTraceParsing(unittest.TestCase):
+    """Test how SimulatedCircuit sorts and loads raw simulation traces."""
+    
+    def setUp(self):
+        """Set up stub raw data with node, branch and sweep traces."""
+        self.raw_data = _StubRawData({
+            'v-sweep': np.array([0.0, 1.0]),
+            'v(n1)': np.array([5.0, 5.0]),
+            'V(N2)': np.array([2.5, 2.5]),
+            'i(v1)': np.array([-0.001, -0.001]),
+        })
+        self.result = SimulatedCircuit(
+            analysis_type="DC Sweep",
+            raw_data=self.raw_data,
+            trace_names=self.raw_data.get_trace_names()
+        )
+    
+    def test_traces_parsed_on_first_use(self):
+        """Test that trace names are only sorted into nodes and branches when first needed."""
+        self.assertTrue(self.result._parse_pending)
+        
+        self.assertIn('v1', self.result.branches)
+        self.assertFalse(self.result._parse_pending)
+    
+    def test_analysis_predicates_follow_analysis_type(self):
+        """Test that the is_* predicates stay in sync when analysis_type is reassigned."""
+        self.assertTrue(self.result.is_dc_sweep())
+        
+        self.result.analysis_type = "Transient Analysis"
+        
+        self.assertTrue(self.result.is_transient())
+        self.assertFalse(self.result.is_dc_sweep())
+    
+    def test_sweep_variable_read_from_sweep_trace(self):
+        """Test that the DC sweep axis is found although it is not a node voltage."""
+        np.testing.assert_array_equal(self.result.get_sweep_variable(), [0.0, 1.0])
+    
+    def test_traces_sorted_into_nodes_and_branches(self):
+        """Test that v(...) traces become nodes and i(...) traces become branches."""
+        self.assertEqual(sorted(self.result.nodes), ['N2', 'n1'])
+        self.assertEqual(list(self.result.branches), ['v1'])
+    
+    def test_trace_data_loaded_on_first_access(self):
+        """Test that trace data is only read when a node is looked up, and only once."""
+        self.assertEqual(self.raw_data.reads, [])
+        
+        self.assertEqual(self.result._get_node_voltage_value('N1')[0], 5.0)
+        self.assertEqual(self.result._get_node_voltage_value('N1')[0], 5.0)
+        
+        self.assertEqual(self.raw_data.reads, ['v(n1)'])
+    
+    def test_membership_test_reads_no_trace_data(self):
+        """Test that checking whether a node or branch exists does not read its data."""
+        self.assertIn('n1', self.result.nodes)
+        self.assertNotIn('n3', self.result.nodes)
+        self.assertIn('v1', self.result.branches)
+        
+        self.assertEqual(self.raw_data.reads, [])
+    
+    def test_node_lookup_is_case_insensitive(self):
+        """Test that node names are matched regardless of the case used in the trace names."""
+        self.assertEqual(self.result._get_node_voltage_value('n2')[0], 2.5)
+        self.assertEqual(self.result._get_node_voltage_value('N2')[0], 2.5)
+        
+        with self.assertRaises(ValueError):
+            self.result._get_node_voltage_value('N3')
+        
+        self.assertEqual(self.result._get_branch_current_value('V1')[0], -0.001)
+        self.assertIsNone(self.result._get_branch_current_value('v2'))
+    
+    def test_extract_value_does_not_copy_float64_arrays(self):
+        """Test that float64 traces are returned as-is and single points as floats."""
+        data = self.result.nodes['n1']
+        
+        self.assertIs(self.result._extract_value(data), data)
+        self.assertEqual(self.result._extract_value(np.array([2.5])), 2.5)
+        self.assertIsInstance(self.result._extract_value(np.array([2.5])), float)
+        
+        # Other dtypes are still converted to float arrays
+        converted = self.result._extract_value(np.array([1, 2], dtype=np.float32))
+        self.assertEqual(converted.dtype, np.float64)
+    
+    def test_float32_results(self):
+        """Test that traces are converted once when single precision results are requested."""
+        result = SimulatedCircuit(
+            analysis_type="DC Sweep",
+            dtype=np.float32,
+            raw_data=self.raw_data,
+            trace_names=self.raw_data.get_trace_names()
+        )
+        
+        data = result.nodes['n1']
+        
+        self.assertEqual(data.dtype, np.float32)
+        self.assertIs(result._extract_value(data), data)
+
+    def test_to_numpy_dict(self):
+        """Test that traces are exported in one pass, by file or requested name."""
+        all_traces = self.result.to_numpy_dict()
+        self.assertEqual(list(all_traces), ['v-sweep', 'v(n1)', 'V(N2)', 'i(v1)'])
+        np.testing.assert_array_equal(all_traces['V(N2)'], [2.5, 2.5])
+        
+        selected = self.result.to_numpy_dict(['V-SWEEP', 'v(n2)'])
+        self.assertEqual(list(selected), ['v-sweep', 'V(N2)'])
+        
+        with self.assertRaises(KeyError):
+            self.result.to_numpy_dict(['v(n9)'])
+    
+    def test_to_numpy_dict_keeps_axis_precision(self):
+        """Test that single precision exports convert traces but not the sweep axis."""
+        result = SimulatedCircuit(
+            analysis_type="DC Sweep",
+            dtype=np.float32,
+            raw_data=self.raw_data,
+            trace_names=self.raw_data.get_trace_names()
+        )
+        
+        traces = result.to_numpy_dict()
+        
+        self.assertEqual(traces['v-sweep'].dtype, np.float64)
+        self.assertEqual(traces['v(n1)'].dtype, np.float32)
+    
+    def test_nodes_named_sweep_are_not_axes(self):
+        """Test that a node with 'sweep' in its name is converted and not taken for the sweep axis."""
+        raw_data = _StubRawData({
+            'v(sweep_out)': np.array([1.0, 2.0]),
+            'i-sweep': np.array([0.0, 0.5]),
+        })
+        result = SimulatedCircuit(
+            analysis_type="DC Sweep",
+            dtype=np.float32,
+            raw_data=raw_data,
+            trace_names=raw_data.get_trace_names()
+        )
+        
+        np.testing.assert_array_equal(result.get_sweep_variable(), [0.0, 0.5])
+        traces = result.to_numpy_dict()
+        self.assertEqual(traces['v(sweep_out)'].dtype, np.float32)
+        self.assertEqual(traces['i-sweep'].dtype, np.float64)
+    
+    def test_to_dataframe(self):
+        """Test that traces are exported as DataFrame columns."""
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas not installed")
+        
+        frame = self.result.to_dataframe(['v-sweep', 'v(n1)'])
+        
+        self.assertEqual(list(frame.columns), ['v-sweep', 'v(n1)'])
+        self.assertEqual(frame['v(n1)'].tolist(), [5.0, 5.0])
+
+
+class TestLazyRawRead(unittest.TestCase):
+    """Test reading binary NGspice raw files through LazyRawRead."""
+
+    def setUp(self):
+        """Write a small binary raw file with two points of three variables."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.raw_file = os.path.join(self.temp_dir.name, 'test.raw')
+        header = (
+            "Title: test\n"
+            "Plotname: Transient Analysis\n"
+            "Flags: real\n"
+            "No. Variables: 3\n"
+            "No. Points: 2\n"
+            "Variables:\n"
+            "\t0\ttime\ttime\n"
+            "\t1\tv(n1)\tvoltage\n"
+            "\t2\ti(v1)\tcurrent\n"
+            "Binary:\n"
+        )
+        data = np.array([[0.0, 1.0, -0.001], [1e-3, 2.0, -0.002]], dtype='<f8')
+        with open(self.raw_file, 'wb') as f:
+            f.write(header.encode('ascii'))
+            f.write(data.tobytes())
+
+    def tearDown(self):
+        """Remove the temporary raw file."""
+        self.temp_dir.cleanup()
+
+    def test_traces_read_from_binary_file(self):
+        """Test that traces are the columns of the point-major data section."""
+        raw_data = LazyRawRead(self.raw_file)
+
+        self.assertEqual(raw_data.get_trace_names(), ['time', 'v(n1)', 'i(v1)'])
+        np.testing.assert_array_equal(raw_data.get_wave('time'), [0.0, 1e-3])
+        np.testing.assert_array_equal(raw_data.get_wave('V(N1)'), [1.0, 2.0])
+        np.testing.assert_array_equal(raw_data.get_wave('i(v1)'), [-0.001, -0.002])
+
+        with self.assertRaises(IndexError):
+            raw_data.get_wave('v(missing)')
+
+    def test_selected_traces_loaded_on_creation(self):
+        """Test that only the axis and the selected traces are read up front."""
+        raw_data = LazyRawRead(self.raw_file, traces=['I(V1)'])
+
+        self.assertEqual(sorted(raw_data._columns), [0, 2])
+        np.testing.assert_array_equal(raw_data.get_wave('i(v1)'), [-0.001, -0.002])
+
+        # Other traces are read from the file when first used
+        np.testing.assert_array_equal(raw_data.get_wave('v(n1)'), [1.0, 2.0])
+        self.assertEqual(sorted(raw_data._columns), [0, 1, 2])
+
+    def test_loaded_traces_outlive_file(self):
+        """Test that loaded traces stay readable after the file is removed."""
+        raw_data = LazyRawRead(self.raw_file, traces=['v(n1)'])
+        os.remove(self.raw_file)
+
+        np.testing.assert_array_equal(raw_data.get_wave('v(n1)'), [1.0, 2.0])
+        with self.assertRaises(OSError):
+            raw_data.get_wave('i(v1)')
+
+    def test_readers_hold_no_open_files(self):
+        """Test that readers kept alive don't keep their raw file open."""
+        if not os.path.isdir('/proc/self/fd'):
+            self.skipTest("no /proc/self/fd to count open files")
+        open_files = len(os.listdir('/proc/self/fd'))
+
+        readers = [LazyRawRead(self.raw_file) for _ in range(50)]
+
+        self.assertEqual(len(os.listdir('/proc/self/fd')), open_files)
+        np.testing.assert_array_equal(readers[-1].get_wave('v(n1)'), [1.0, 2.0])
+
+    def test_truncated_file_rejected(self):
+        """Test that a data section shorter than the header promises is rejected."""
+        with open(self.raw_file, 'r+b') as f:
+            f.truncate(os.path.getsize(self.raw_file) - 8)
+
+        with self.assertRaises(ValueError):
+            LazyRawRead(self.raw_file)
+
+    def test_bulk_read_returns_contiguous_traces(self):
+        """Test that several traces are gathered at once into contiguous arrays."""
+        raw_data = LazyRawRead(self.raw_file)
+
+        data = raw_data.read_trace_data(['i(v1)', 'v(n1)'])
+
+        self.assertEqual(list(data), ['i(v1)', 'v(n1)'])
+        np.testing.assert_array_equal(data['v(n1)'], [1.0, 2.0])
+        np.testing.assert_array_equal(data['i(v1)'], [-0.001, -0.002])
+        self.assertTrue(data['v(n1)'].flags['C_CONTIGUOUS'])
+
+    def test_ascii_raw_file_rejected(self):
+        """Test that ASCII raw files raise ValueError so callers can fall back."""
+        with open(self.raw_file, 'w') as f:
+            f.write("Title: test\nNo. Variables: 1\nNo. Points: 1\nVariables:\n\t0\ttime\ttime\nValues:\n 0\t0.0\n")
+
+        with self.assertRaises(ValueError):
+            LazyRawRead(self.raw_file)
+
+
 class TestAnalysisTypes(unittest.TestCase):
     """Test different analysis types and their specific functionality."""
     
@@ -398,7 +946,55 @@ class TestBranchCurrentMethods(unittest.TestCase):
         
         self.assertEqual(vs_name, vs_name2)
         self.assertEqual(r1_name, r1_name2)
+
+    def test_get_node_voltages(self):
+        """Test that several node voltages are returned as rows of one array."""
+        result = self.circuit.simulate_operating_point()
+        
+        voltages = result.get_node_voltages([self.vs.pos, self.r1.n2, self.circuit.gnd])
+        
+        self.assertEqual(voltages.shape, (3, 1))
+        np.testing.assert_allclose(voltages[:, 0], [6.0, 0.0, 0.0], atol=1e-9)
+    
+    def test_get_node_voltages_ac(self):
+        """Test that AC node voltages keep their complex values."""
+        result = self.circuit.simulate_ac(start_freq=1, stop_freq=1e3, points_per_decade=5)
+        
+        voltages = result.get_node_voltages([self.vs.pos, self.circuit.gnd])
+        
+        self.assertTrue(np.iscomplexobj(voltages))
+        np.testing.assert_array_equal(voltages[0], result.get_node_voltage(self.vs.pos))
+        np.testing.assert_array_equal(voltages[1], 0.0)
     
+    def test_get_node_voltages_dtype(self):
+        """Test that single precision results aren't upcast when stacked."""
+        backend = SpicelibBackend(dtype=np.float32)
+        result = self.circuit.simulate_transient(1e-5, 1e-4, backend=backend)
+        
+        voltages = result.get_node_voltages([self.vs.pos, self.r1.n2])
+        
+        self.assertEqual(voltages.dtype, np.float32)
+    
+    def test_component_results_cached(self):
+        """Test that component results are extracted once per simulation result."""
+        result = self.circuit.simulate_operating_point()
+
+        r1_results = result.get_component_results(self.r1)
+
+        self.assertIs(result.get_component_results(self.r1), r1_results)
+        self.assertAlmostEqual(r1_results['voltage_across'], 6.0, places=6)
+
+    def test_component_current_cached(self):
+        """Test that a component's current is resolved once per simulation result."""
+        result = self.circuit.simulate_operating_point()
+
+        r1_current = result.get_component_current(self.r1)
+        vs_current = result.get_component_current(self.vs)
+
+        self.assertIs(result.get_component_current(self.r1), r1_current)
+        self.assertIs(result.get_component_current(self.vs), vs_current)
+        self.assertAlmostEqual(abs(r1_current), abs(vs_current), places=6)
+
     def test_branch_current_array_values(self):
         """Test that branch currents handle array values correctly."""
         # Run a transient simulation to get array results
@@ -424,6 +1020,25 @@ class TestBranchCurrentMethods(unittest.TestCase):
 class TestSimulationFailureHandling(unittest.TestCase):
     """Test enhanced error handling when simulations fail."""
     
+    def test_simulation_failure_builds_diagnostics_lazily(self):
+        """Test that failure diagnostics are only collected once, when first needed."""
+        calls = []
+        
+        def collector():
+            calls.append(1)
+            return "=== SIMULATION FAILURE DIAGNOSTICS ==="
+        
+        failure = SimulationFailure("Simulation failed: no results returned", collector)
+        self.assertIsInstance(failure, RuntimeError)
+        self.assertEqual(calls, [])
+        
+        message = str(failure)
+        str(failure)
+        
+        self.assertIn("no results returned", message)
+        self.assertIn("SIMULATION FAILURE DIAGNOSTICS", message)
+        self.assertEqual(calls, [1])
+    
     def test_invalid_circuit_failure_diagnostics(self):
         """Test that simulation failures include diagnostic information."""
         backend = SpicelibBackend()
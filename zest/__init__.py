@@ -7,7 +7,7 @@ and terminal-based connections for clean, readable circuit descriptions.
 
 from .circuit import Circuit, CircuitRoot, SubCircuitDef, SubCircuitInst, NetlistBlock, NodeMapper
 from .components import Component, Terminal, GroundTerminal, VoltageSource, PiecewiseLinearVoltageSource, PulsedVoltageSource, Resistor, Capacitor, Inductor, SubCircuit, CurrentSource, ExternalSubCircuit, gnd
-from .simulation import CircuitSimulator, SimulatedCircuit, check_simulation_requirements, SimulatorBackend, SpicelibBackend
+from .simulation import CircuitSimulator, SimulatedCircuit, check_simulation_requirements, SimulatorBackend, SpicelibBackend, SimulationFailure, SweepRunner
 
 __version__ = "0.1.0"
 
@@ -30,23 +30,21 @@ def cleanup_temp_files(directory="temp_spice_sim", dry_run=False, verbose=False)
         >>> zest.cleanup_temp_files(dry_run=True)  # Show what would be cleaned
     """
     import os
-    import glob
     
     if not os.path.exists(directory):
         if verbose:
             print(f"📁 Directory {directory} doesn't exist - nothing to clean")
         return 0, 0
     
-    # File patterns to clean up
-    patterns = ["*.net", "*.fail", "*.raw", "*.log"]
+    # File extensions to clean up
+    extensions = (".net", ".fail", ".raw", ".log")
     
-    # Use set to avoid duplicates from overlapping patterns
-    files_to_delete = set()
-    for pattern in patterns:
-        files_to_delete.update(glob.glob(os.path.join(directory, pattern)))
-    
-    # Convert back to sorted list
-    files_to_delete = sorted(list(files_to_delete))
+    # A single directory scan finds every candidate, sorted for stable output
+    with os.scandir(directory) as entries:
+        files_to_delete = sorted(
+            (entry for entry in entries if entry.name.endswith(extensions) and entry.is_file()),
+            key=lambda entry: entry.name
+        )
     files_found = len(files_to_delete)
     
     if files_found == 0:
@@ -58,27 +56,26 @@ def cleanup_temp_files(directory="temp_spice_sim", dry_run=False, verbose=False)
         print(f"🧹 Found {files_found} temporary files in {directory}:")
     
     files_deleted = 0
-    for file_path in files_to_delete:
-        file_name = os.path.basename(file_path)
+    for entry in files_to_delete:
+        file_name = entry.name
         
-        # Check if file still exists (might have been deleted by previous pattern)
-        if not os.path.exists(file_path):
+        if dry_run:
+            if verbose:
+                print(f"   📄 Would delete: {file_name} ({entry.stat().st_size} bytes)")
             continue
-            
-        file_size = os.path.getsize(file_path)
         
-        if dry_run:
+        try:
+            file_size = entry.stat().st_size if verbose else None
+            os.remove(entry.path)
             if verbose:
-                print(f"   📄 Would delete: {file_name} ({file_size} bytes)")
-        else:
-            try:
-                os.remove(file_path)
-                if verbose:
-                    print(f"   ✅ Deleted: {file_name} ({file_size} bytes)")
-                files_deleted += 1
-            except OSError as e:
-                if verbose:
-                    print(f"   ❌ Failed to delete {file_name}: {e}")
+                print(f"   ✅ Deleted: {file_name} ({file_size} bytes)")
+            files_deleted += 1
+        except FileNotFoundError:
+            # Removed by someone else in the meantime
+            continue
+        except OSError as e:
+            if verbose:
+                print(f"   ❌ Failed to delete {file_name}: {e}")
     
     if verbose:
         if dry_run:
@@ -96,7 +93,7 @@ __all__ = [
     # Ground reference
     "gnd",
     # Simulation classes
-    "CircuitSimulator", "SimulatedCircuit", "check_simulation_requirements", "SimulatorBackend", "SpicelibBackend",
+    "CircuitSimulator", "SimulatedCircuit", "check_simulation_requirements", "SimulatorBackend", "SpicelibBackend", "SimulationFailure", "SweepRunner",
     # Utilities
     "cleanup_temp_files"
 ] 
\ No newline at end of file
@@ -72,20 +72,44 @@ class NetlistBlock(ABC):
         self._include_models = set()  # Set of external SPICE model text to include
         self.includes = []  # List of external SPICE file dependencies
         self._node_mapper = None  # Cached NodeMapper instance for backward compatibility
+        self._terminal_index = None  # Cached id(terminal) -> owning component map
     
     def add_component(self, component):
         """Add a component to the circuit."""
         if component not in self.components:
             self.components.append(component)
+            self._terminal_index = None
     
     def remove_component(self, component):
         """Remove a component from the circuit."""
         if component in self.components:
             self.components.remove(component)
+            self._terminal_index = None
             # Clear cached name
             if component in self._component_names:
                 del self._component_names[component]
     
+    def _find_terminal_owner(self, terminal):
+        """
+        Find the component of this circuit that owns a terminal.
+        
+        The terminal -> component index is built on first use and kept until
+        components are added or removed.
+        
+        Args:
+            terminal: Terminal object to look up
+            
+        Returns:
+            Component or None: The owning component, or None if no component has the terminal
+        """
+        if self._terminal_index is None:
+            self._terminal_index = {
+                id(comp_terminal): component
+                for component in self.components
+                for _, comp_terminal in component.get_terminals()
+            }
+        return self._terminal_index.get(id(terminal))
+    
     def wire(self, terminal1, terminal2):
         """
         Connect two terminals with a wire.
@@ -0,0 +1,204 @@
+"""
+Lazy reader for binary SPICE raw files written by NGspice.
+
+Only the ASCII header of a raw file is parsed up front. Trace data is read
+from the file when it is asked for (or when the reader is told which traces
+to load right away), so memory use grows with the traces that are actually
+used rather than with the size of the file. No file descriptor or mapping is
+held between reads.
+
+NGspice stores binary data point by point: for every point (time step, sweep
+value or frequency) one value per variable. The data section is therefore a
+(points x variables) matrix and a trace is one of its columns. Reading all
+columns is a single readinto; a subset is gathered in one pass over a short-lived
+read-only mapping of the file.
+"""
+
+import mmap
+import os
+import numpy as np
+
+
+class LazyRawRead:
+    """
+    Lazily loaded view of a binary NGspice raw file.
+
+    Only the first plot of the file is read. ASCII raw files ("Values:" section)
+    are not supported; a ValueError is raised for them so callers can fall back
+    to a full reader such as spicelib's RawRead.
+
+    The first variable (the time, frequency or sweep axis, if the analysis has
+    one) and the given traces are loaded when the reader is created. Any other
+    trace is read from the file on first access, so the file must still exist
+    by then.
+
+    Args:
+        raw_filename: Path to the raw file
+        traces: Names of the traces to load right away (case-insensitive), or
+            None to load all of them
+
+    Raises:
+        ValueError: If the file is not a binary NGspice raw file
+        IndexError: If the file has no trace with one of the given names
+    """
+
+    def __init__(self, raw_filename, traces=None):
+        self.raw_filename = str(raw_filename)
+
+        with open(self.raw_filename, 'rb') as f:
+            self.header = self._read_header(f)
+            self._data_offset = f.tell()
+            file_size = os.fstat(f.fileno()).st_size
+
+        try:
+            self.n_variables = int(self.header['No. Variables'])
+            self.n_points = int(self.header['No. Points'])
+        except (KeyError, ValueError):
+            raise ValueError(f"{self.raw_filename}: raw file header lacks variable or point counts")
+
+        self._dtype = np.dtype('<c16' if 'complex' in self.header.get('Flags', '').lower() else '<f8')
+        if file_size - self._data_offset < self.n_points * self.n_variables * self._dtype.itemsize:
+            raise ValueError(f"{self.raw_filename}: raw file is truncated")
+
+        # Column index -> loaded trace data
+        self._columns = {}
+        if traces is None:
+            self._load(range(self.n_variables))
+        else:
+            axis = [0] if self.n_variables else []
+            self._load(axis + [self._column(trace_name) for trace_name in traces])
+
+    def _read_header(self, f):
+        """Parse the ASCII header up to the 'Binary:' marker into a dict."""
+        header = {}
+        self._trace_names = []
+        self._trace_index = {}
+
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError(f"{self.raw_filename}: no binary data section found")
+            line = line.decode('ascii', errors='replace').strip()
+
+            if line == 'Binary:':
+                return header
+            if line == 'Values:':
+                raise ValueError(f"{self.raw_filename}: ASCII raw files are not supported")
+
+            if line == 'Variables:':
+                for index in range(int(header.get('No. Variables', 0))):
+                    fields = f.readline().decode('ascii', errors='replace').split()
+                    if len(fields) < 2:
+                        raise ValueError(f"{self.raw_filename}: invalid variable line {fields}")
+                    self._trace_names.append(fields[1])
+                    self._trace_index[fields[1]] = index
+                    # Trace names are case-insensitive; the exact spelling wins over case folding
+                    self._trace_index.setdefault(fields[1].lower(), index)
+                continue
+
+            key, _, value = line.partition(':')
+            if key and key not in header:
+                header[key] = value.strip()
+
+    def get_trace_names(self):
+        """
+        Get the names of all traces in the file.
+
+        Returns:
+            list: Trace names in file order
+        """
+        return list(self._trace_names)
+
+    def get_wave(self, trace_name):
+        """
+        Get the data of one trace, reading it from the file if it isn't loaded yet.
+
+        Args:
+            trace_name: Name of the trace (case-insensitive)
+
+        Returns:
+            numpy.ndarray: Trace data
+
+        Raises:
+            IndexError: If the file has no trace with that name
+        """
+        column = self._column(trace_name)
+        if column not in self._columns:
+            self._load([column])
+        return self._columns[column]
+
+    def load_traces(self, trace_names):
+        """
+        Read several traces from the file now, in a single pass.
+
+        Args:
+            trace_names: Names of the traces (case-insensitive)
+
+        Raises:
+            IndexError: If the file has no trace with one of the names
+        """
+        self._load([self._column(trace_name) for trace_name in trace_names])
+
+    def read_trace_data(self, trace_names):
+        """
+        Get the data of several traces at once.
+
+        A single trace is a strided column of the point-major data section, so
+        reading traces one by one walks the whole section once per trace. Traces
+        that aren't loaded yet are gathered in one pass instead.
+
+        Args:
+            trace_names: Names of the traces (case-insensitive)
+
+        Returns:
+            dict: Trace name -> contiguous numpy array with that trace's data
+
+        Raises:
+            IndexError: If the file has no trace with one of the names
+        """
+        columns = [self._column(trace_name) for trace_name in trace_names]
+        self._load(columns)
+        return {
+            trace_name: np.ascontiguousarray(self._columns[column])
+            for trace_name, column in zip(trace_names, columns)
+        }
+
+    def _load(self, columns):
+        """Read the given columns of the data section that aren't loaded yet."""
+        missing = sorted(set(columns) - self._columns.keys())
+        if not missing:
+            return
+        if self.n_points == 0:
+            for column in missing:
+                self._columns[column] = np.empty(0, dtype=self._dtype)
+            return
+
+        with open(self.raw_filename, 'rb') as f:
+            if len(missing) == self.n_variables:
+                # Everything: read the data section straight into one array
+                data = np.empty((self.n_points, self.n_variables), dtype=self._dtype)
+                f.seek(self._data_offset)
+                if f.readinto(data.reshape(-1).view(np.uint8)) < data.nbytes:
+                    raise ValueError(f"{self.raw_filename}: raw file is truncated")
+                block = data.T
+            else:
+                # A subset: copy just those columns out of a mapping that is closed right after
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    data = np.frombuffer(mapped, dtype=self._dtype, count=self.n_points * self.n_variables,
+                                         offset=self._data_offset).reshape(self.n_points, self.n_variables)
+                    block = np.ascontiguousarray(data[:, missing].T)
+                    # The mapping can only be closed once no array refers to it
+                    del data
+
+        # Row i of the block is the i-th missing column
+        for row, column in enumerate(missing):
+            self._columns[column] = block[row]
+
+    def _column(self, trace_name):
+        """Return the column index of a trace in the data section."""
+        index = self._trace_index.get(trace_name)
+        if index is None:
+            index = self._trace_index.get(trace_name.lower())
+        if index is None:
+            raise IndexError(f"{self.raw_filename} doesn't contain trace \"{trace_name}\"")
+        return index
@@ -9,6 +9,15 @@ temporary files (netlists, raw simulation data, log files) are managed:
 - cleanup="verbose": Clean up files with debug output showing what's being removed  
 - cleanup="keep": Keep all files for debugging (files remain in temp_spice_sim/)
 
+Unless files are kept, each simulation runs in its own temporary directory that
+is removed as a whole once the results have been read. These directories are
+created in /dev/shm when available, or in the directory named by the
+ZEST_SIM_TMP environment variable.
+
+Setting ZEST_SIM_CACHE to a directory enables a persistent result cache: raw
+files are stored there by netlist hash and identical netlists are not simulated
+again.
+
 Usage examples:
     # Default silent cleanup
     result = circuit.simulate_operating_point()
@@ -26,12 +35,135 @@ The cleanup system automatically handles:
 - Failed simulation files (*.fail)
 """
 
+import functools
+import hashlib
+import os
+import re
+import shutil
 import numpy as np
 from pathlib import Path
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
 
 # PySpice imports removed - now using SpicelibBackend exclusively
+try:
+    from spicelib import SimRunner, RawRead
+    from spicelib.simulators.ngspice_simulator import NGspiceSimulator
+    _SPICELIB_AVAILABLE = True
+except ImportError:
+    _SPICELIB_AVAILABLE = False
+
+from .rawfile import LazyRawRead
+
+# Free space /dev/shm needs to be used for simulation files; containers often give it only 64 MB
+_SCRATCH_MIN_FREE = 1 << 30
+
+
+def _scratch_root():
+    """
+    Return the directory in which per-run simulation folders are created.
+    
+    The ZEST_SIM_TMP environment variable overrides the location. Otherwise the
+    RAM-backed /dev/shm is used when it is available, writable and has at least
+    _SCRATCH_MIN_FREE bytes free, so that netlist, raw and log files never touch
+    the disk; elsewhere this returns None and tempfile picks the system temporary
+    directory. Set ZEST_SIM_TMP when the raw files of large simulations don't fit.
+    """
+    override = os.environ.get('ZEST_SIM_TMP')
+    if override:
+        return override
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        try:
+            if shutil.disk_usage('/dev/shm').free >= _SCRATCH_MIN_FREE:
+                return '/dev/shm'
+        except OSError:
+            pass
+    return None
+
+
+def _result_cache_root():
+    """
+    Return the directory of the persistent simulation result cache, or None if it is disabled.
+    
+    The cache is enabled by pointing the ZEST_SIM_CACHE environment variable at a
+    directory. Raw files are stored there under a hash of the complete netlist, so
+    simulating an identical netlist again reads the stored results instead of
+    running NGspice. Files pulled in with .include are not part of the hash; clear
+    the cache after changing them. Binary traces of cached results are read from
+    the cache file when they are first used, so don't clear the cache while such
+    results are still in use.
+    """
+    return os.environ.get('ZEST_SIM_CACHE') or None
+
+
+@functools.lru_cache(maxsize=None)
+def _keep_folder(cwd):
+    """
+    Return the absolute temp_spice_sim/ folder used with cleanup="keep" for a working directory.
+    
+    Keyed by the working directory, so changing directories still picks the right folder.
+    """
+    # If we're in a subdirectory (like tests/), go up to project root
+    if os.path.basename(cwd) == 'tests':
+        cwd = os.path.dirname(cwd)
+    return os.path.join(cwd, 'temp_spice_sim')
+
+
+# SPICE control line for each supported analysis, built from the run() keyword arguments
+_ANALYSIS_FORMATTERS = {
+    'transient': lambda kw: f".tran {kw.get('step_time', 1e-6)} {kw.get('end_time', 1e-3)} UIC",
+    'ac': lambda kw: f".ac dec {kw.get('points_per_decade', 10)} {kw.get('start_freq', 1)} {kw.get('end_freq', 1e6)}",
+    'dc': lambda kw: f".dc {kw['source_name']} {kw.get('start', 0)} {kw.get('stop', 5)} {kw.get('step', 0.1)}",
+    'op': lambda kw: '.op',
+}
+
+# A SPICE number with an optional scale or unit suffix, e.g. 5, -1.5e-3, 2.2k, 10uF
+_VALUE_FIELD = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)(e[+-]?\d+)?[a-z]*$', re.IGNORECASE)
+
+# Analysis type reported by SimulatedCircuit for each supported analysis
+_ANALYSIS_TYPES = {
+    'transient': 'Transient Analysis',
+    'ac': 'AC Analysis',
+    'dc': 'DC Sweep',
+    'op': 'DC Operating Point',
+}
+
+
+class SimulationFailure(RuntimeError):
+    """
+    Raised when a simulation fails.
+    
+    The diagnostic report (netlist, log, fail and raw file details) is built by
+    the given collector the first time it is needed, usually when the error
+    message is rendered.
+    """
+    
+    def __init__(self, message, collector=None):
+        super().__init__(message)
+        self._collector = collector
+        self._diagnostics = None
+    
+    @property
+    def diagnostics(self):
+        """str: Diagnostic report for the failed simulation, or None if there is none."""
+        if self._collector is not None:
+            collector, self._collector = self._collector, None
+            try:
+                self._diagnostics = collector()
+            except Exception as e:
+                self._diagnostics = f"Could not collect failure diagnostics: {e}"
+        return self._diagnostics
+    
+    def __str__(self):
+        message = super().__str__()
+        if self.diagnostics:
+            return f"{message}\n\n{self.diagnostics}"
+        return message
 
 
 class SimulatorBackend(ABC):
@@ -64,8 +196,45 @@ class SpicelibBackend(SimulatorBackend):
     
     This backend generates SPICE netlists and runs them through NGspice
     using the spicelib library, which provides clean access to simulation results.
+    
+    Args:
+        keep_folder: Folder for the files of cleanup="keep" runs (default:
+            temp_spice_sim/ in the project root, derived from the working directory)
+        result_cache_size: Number of recent results kept in memory, so simulating
+            an identical netlist again with this backend skips NGspice (default: 0,
+            no cache). Every cached result holds a copy of all its traces, so only
+            enable this for a backend that is reused for repeating netlists
+        cache_dir: Directory of the persistent result cache (default: the
+            ZEST_SIM_CACHE environment variable; see _result_cache_root)
+        dtype: Default floating point type of node and branch values, used when
+            run() isn't given one (default: np.float64; np.float32 halves the
+            memory of long transient and AC waveforms)
     """
     
+    # SimRunner shared by all backend instances, created on first use
+    _runner = None
+    _runner_lock = threading.Lock()
+    
+    def __init__(self, keep_folder=None, result_cache_size=0, cache_dir=None, dtype=np.float64):
+        self.keep_folder = os.path.abspath(keep_folder) if keep_folder is not None else None
+        self.cache_dir = os.fspath(cache_dir) if cache_dir is not None else None
+        self.dtype = np.dtype(dtype)
+        self.result_cache_size = result_cache_size
+        # (netlist hash, traces) -> read-only trace arrays, least recently used first
+        self._result_cache = OrderedDict()
+    
+    @classmethod
+    def _get_runner(cls):
+        """Return the shared SimRunner, creating it on first use."""
+        if cls._runner is None:
+            with cls._runner_lock:
+                # Backends used from several threads must still end up with a single runner
+                if cls._runner is None:
+                    # Without an output folder ngspice writes its results next to the
+                    # netlist, i.e. into the output folder of the current run
+                    cls._runner = SimRunner(simulator=NGspiceSimulator, parallel_sims=os.cpu_count() or 4)
+        return cls._runner
+    
     def run(self, netlist: str, analyses: list[str], **kwargs):
         """
         Run simulation analyses using spicelib with NGspice.
@@ -82,174 +251,366 @@ class SpicelibBackend(SimulatorBackend):
                 source_name, start, stop, step: For DC sweep analysis
                 start_freq, stop_freq, points_per_decade: For AC analysis
                 temperature: Simulation temperature in Celsius
+                dtype: Floating point type of the returned node and branch values
+                    (default: the backend's dtype)
+                traces: Names of the traces to load, e.g. ['v(n1)', 'i(v1)']
+                    (default: all); the sweep axis is always loaded
             
         Returns:
             SimulatedCircuit: Simulation results
         """
-        try:
-            from spicelib import SimRunner, RawRead
-            from spicelib.simulators.ngspice_simulator import NGspiceSimulator
-            import tempfile
-            import os
-            
-            # Add analysis commands to netlist based on requested analyses
-            modified_netlist = self._add_analysis_commands(netlist, analyses, **kwargs)
-            
-            # Create temporary netlist file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.net', delete=False) as f:
+        if not _SPICELIB_AVAILABLE:
+            raise RuntimeError("spicelib not installed. Run: pip install spicelib")
+        
+        cleanup_mode = kwargs.get('cleanup', 'silent')
+        kwargs.setdefault('dtype', self.dtype)
+        
+        # Add analysis commands to netlist based on requested analyses
+        modified_netlist = self._add_analysis_commands(netlist, analyses, **kwargs)
+        
+        # Reuse the results of an identical netlist simulated recently by this backend
+        # (unless the run's files are to be kept for inspection)
+        traces = kwargs.get('traces')
+        memory_key = self._memory_key(modified_netlist, traces)
+        raw_data = self._recall_result(memory_key) if cleanup_mode != 'keep' else None
+        if raw_data is not None:
+            return self._build_result(raw_data, analyses, **kwargs)
+        
+        # Reuse the results of an identical netlist from the persistent cache, if enabled
+        # (again unless the run's files are to be kept, which needs a real run)
+        cache_file = self._cache_file(modified_netlist)
+        if cache_file is not None and cleanup_mode != 'keep':
+            try:
+                raw_data = self._read_raw_file(cache_file, traces, lazy=True)
+            except (OSError, ValueError):
+                pass  # Not cached yet (or unreadable) - simulate and store it below
+            else:
+                self._remember_result(memory_key, raw_data)
+                return self._build_result(raw_data, analyses, **kwargs)
+        
+        with self._output_folder(cleanup_mode, self.keep_folder) as output_folder:
+            # Write the netlist into the output folder so it shares the folder's lifetime
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.net', dir=output_folder, delete=False) as f:
                 f.write(modified_netlist)
                 netlist_file = f.name
+            # spicelib runs a copy of the netlist named <base_name>_<n>.net, where n is the
+            # shared runner's run counter, and names the output files after that copy
+            base_name = Path(netlist_file).stem
             
-            # Variable to track output files for cleanup
+            # Variable to track spicelib output for diagnostics
             result = None
-            raw_file = None
+            
+            def diagnostics():
+                # Deferred until a SimulationFailure needs its report
+                return self._collect_failure_diagnostics(
+                    netlist_file, result, output_folder, base_name=base_name
+                )
             
             try:
-                # Create spicelib runner with consistent output folder
-                import os
-                # Use absolute path to ensure consistent temp directory regardless of working directory
-                output_folder = os.path.join(os.getcwd(), 'temp_spice_sim')
-                # If we're in a subdirectory (like tests/), go up to project root
-                if os.path.basename(os.getcwd()) == 'tests':
-                    output_folder = os.path.join(os.path.dirname(os.getcwd()), 'temp_spice_sim')
-                
-                runner = SimRunner(simulator=NGspiceSimulator, output_folder=output_folder)
+                runner = self._get_runner()
                 
                 # Run simulation
                 result = runner.run_now(netlist_file)
                 
                 if not result or not result[0]:
-                    # Simulation failed - collect diagnostic information
-                    error_details = self._collect_failure_diagnostics(
-                        netlist_file, result, output_folder, 
-                        base_name=os.path.splitext(os.path.basename(netlist_file))[0]
-                    )
-                    raise RuntimeError(f"Simulation failed: no results returned\n\n{error_details}")
+                    # Simulation failed - diagnostics are collected when the error is shown
+                    raise SimulationFailure("Simulation failed: no results returned", diagnostics)
                 
                 # Read simulation results
                 raw_file = result[0]
                 try:
-                    raw_data = RawRead(raw_file)
+                    raw_data = self._read_raw_file(raw_file, traces)
                 except Exception as e:
-                    # Failed to read simulation results - collect diagnostic information
-                    error_details = self._collect_failure_diagnostics(
-                        netlist_file, result, output_folder, 
-                        base_name=os.path.splitext(os.path.basename(netlist_file))[0]
-                    )
-                    raise RuntimeError(f"Simulation failed: unable to read results: {e}\n\n{error_details}")
-                
-                # Get available traces
-                trace_names = raw_data.get_trace_names()
-                
-                # Extract time vector (common to all analyses)
-                time_trace = None
-                if 'time' in trace_names:
-                    time_trace = raw_data.get_trace('time')
+                    # Failed to read simulation results
+                    raise SimulationFailure(f"Simulation failed: unable to read results: {e}", diagnostics)
                 
-                # Create SimulatedCircuit result
-                # Map analysis types to expected format
-                analysis_type_map = {
-                    'transient': 'Transient Analysis',
-                    'ac': 'AC Analysis', 
-                    'dc': 'DC Sweep',
-                    'op': 'DC Operating Point'
-                }
-                analysis_type = analysis_type_map.get(analyses[0], 'Transient Analysis') if analyses else 'Transient Analysis'
+                if cache_file is not None:
+                    self._store_in_cache(raw_file, cache_file)
+                self._remember_result(memory_key, raw_data)
                 
-                return SimulatedCircuit(
-                    circuit=kwargs.get('circuit', None),  # Pass circuit for node name resolution
-                    analysis_type=analysis_type,
-                    time=time_trace.data if time_trace else None,
-                    raw_data=raw_data,  # Store raw data for node voltage extraction
-                    trace_names=trace_names
-                )
-                
-            finally:
-                # Clean up temporary files based on cleanup mode
-                cleanup_mode = kwargs.get('cleanup', 'silent')
+                return self._build_result(raw_data, analyses, **kwargs)
                 
+            except SimulationFailure as failure:
                 if cleanup_mode != 'keep':
-                    files_to_clean = [netlist_file]
-                    
-                    # Get base name for pattern matching
-                    base_name = os.path.splitext(os.path.basename(netlist_file))[0]
-                    
-                    # Add output files from spicelib simulation
-                    if result and result[0]:
-                        raw_file_path = str(result[0])
-                        files_to_clean.append(raw_file_path)  # Convert Path to string
-                        
-                        # Also clean up the corresponding .log file
-                        log_file = raw_file_path.replace('.raw', '.log')
-                        if os.path.exists(log_file):
-                            files_to_clean.append(log_file)
-                            
-                        # Also clean up the corresponding .net file in the output directory
-                        net_file = raw_file_path.replace('.raw', '.net')
-                        if os.path.exists(net_file):
-                            files_to_clean.append(net_file)
-                    else:
-                        # If spicelib didn't return expected results, look for files by pattern
-                        # This handles cases where simulation failed but files were still created
-                        import glob
-                        raw_pattern = os.path.join(output_folder, f"{base_name}*.raw")
-                        log_pattern = os.path.join(output_folder, f"{base_name}*.log")
-                        net_pattern = os.path.join(output_folder, f"{base_name}*.net")
-                        
-                        files_to_clean.extend(glob.glob(raw_pattern))
-                        files_to_clean.extend(glob.glob(log_pattern))
-                        files_to_clean.extend(glob.glob(net_pattern))
-                    
-                    # Look for any .fail files from failed simulations (common pattern: tmpXXXXXX_1.fail)
-                    import glob
-                    fail_pattern = os.path.join(output_folder, f"{base_name}*.fail")
-                    fail_files = glob.glob(fail_pattern)
-                    files_to_clean.extend(fail_files)
-                    
-                    verbose_cleanup = (cleanup_mode == 'verbose')
-                    if verbose_cleanup:
-                        print(f"🧹 Cleanup: Found {len(files_to_clean)} files to clean:")
-                        for f in files_to_clean:
-                            print(f"  - {f} (exists: {os.path.exists(f)})")
-                    
-                    # Clean up all temporary files
-                    cleaned_count = 0
-                    for file_path in files_to_clean:
-                        if os.path.exists(file_path):
-                            try:
-                                os.unlink(file_path)
-                                cleaned_count += 1
-                                if verbose_cleanup:
-                                    print(f"  ✅ Cleaned: {file_path}")
-                            except OSError as e:
-                                if verbose_cleanup:
-                                    print(f"  ❌ Failed to clean {file_path}: {e}")
-                                pass
-                    
-                    if verbose_cleanup:
-                        print(f"🧹 Cleanup completed: {cleaned_count}/{len(files_to_clean)} files removed")
-                    
-        except ImportError:
-            raise RuntimeError("spicelib not installed. Run: pip install spicelib")
-        except RuntimeError as e:
-            # Re-raise RuntimeError (including our enhanced failure diagnostics)
-            raise e
-        except Exception as e:
-            # Handle other exceptions from spicelib - collect diagnostics if possible
+                    # Build the report now - the files it reads go away with the output folder
+                    failure.diagnostics
+                raise
+            except RuntimeError:
+                raise
+            except Exception as e:
+                # Handle other exceptions from spicelib
+                failure = SimulationFailure(f"Simulation failed with exception: {e}", diagnostics)
+                if cleanup_mode != 'keep':
+                    failure.diagnostics
+                raise failure from e
+
+    @staticmethod
+    def _build_result(raw_data, analyses, **kwargs):
+        """
+        Wrap raw simulation data in a SimulatedCircuit.
+        
+        Args:
+            raw_data: Raw data object providing get_trace_names() and get_wave()
+            analyses: List of analysis types that were run
+            **kwargs: Simulation parameters passed to run()
+            
+        Returns:
+            SimulatedCircuit: Simulation results
+        """
+        # Get available traces
+        trace_names = raw_data.get_trace_names()
+        if kwargs.get('traces') is not None:
+            trace_names = _select_traces(trace_names, kwargs['traces'])
+        
+        # Extract time vector (common to all analyses)
+        time_trace = None
+        if 'time' in trace_names:
+            time_trace = raw_data.get_wave('time')
+        
+        # Create SimulatedCircuit result
+        analysis_type = _ANALYSIS_TYPES.get(analyses[0], 'Transient Analysis') if analyses else 'Transient Analysis'
+        
+        return SimulatedCircuit(
+            circuit=kwargs.get('circuit', None),  # Pass circuit for node name resolution
+            analysis_type=analysis_type,
+            dtype=kwargs.get('dtype', np.float64),
+            time=time_trace,
+            raw_data=raw_data,  # Store raw data for node voltage extraction
+            trace_names=trace_names
+        )
+    
+    @staticmethod
+    def _memory_key(netlist, traces):
+        """Return the in-memory result cache key for a complete netlist and the requested traces."""
+        return (
+            hashlib.blake2b(netlist.encode(), digest_size=16).digest(),
+            tuple(traces) if traces is not None else None,
+        )
+    
+    def _recall_result(self, key):
+        """
+        Return raw data for the results cached in memory under key, or None.
+        
+        Every hit gets its own copy of the traces, so results handed out earlier
+        (and modified in place by their callers) never affect later hits.
+        """
+        traces = self._result_cache.get(key)
+        if traces is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return _ArrayRawData({name: data.copy() for name, data in traces.items()})
+    
+    def _remember_result(self, key, raw_data):
+        """Cache a read-only snapshot of raw data in memory under key, evicting the least recently used results."""
+        if self.result_cache_size <= 0:
+            return
+        trace_names = raw_data.get_trace_names()
+        if key[1] is not None:
+            trace_names = _select_traces(trace_names, key[1])
+        # Snapshot the traces - the caller's result shares (and may modify) the raw data itself
+        read_trace_data = getattr(raw_data, 'read_trace_data', None)
+        if read_trace_data is not None:
+            traces = read_trace_data(trace_names)
+        else:
+            traces = {name: np.array(raw_data.get_wave(name)) for name in trace_names}
+        for data in traces.values():
+            data.setflags(write=False)
+        self._result_cache[key] = traces
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _cache_file(self, netlist):
+        """Return the result cache path for a complete netlist, or None if caching is disabled."""
+        cache_root = self.cache_dir or _result_cache_root()
+        if cache_root is None:
+            return None
+        key = hashlib.blake2b(netlist.encode(), digest_size=16).hexdigest()
+        return os.path.join(cache_root, f"{key}.raw")
+    
+    @staticmethod
+    def _store_in_cache(raw_file, cache_file):
+        """
+        Store a raw file in the result cache.
+        
+        The file is copied into a staging file that is unique to this call, then
+        moved into place atomically, so concurrent readers never see a partial file
+        and concurrent writers (threads or processes) never share a staging file.
+        Failing to cache is not an error.
+        """
+        staging_file = None
+        try:
+            cache_root = os.path.dirname(cache_file)
+            os.makedirs(cache_root, exist_ok=True)
+            fd, staging_file = tempfile.mkstemp(suffix='.tmp', dir=cache_root)
+            os.close(fd)
+            shutil.copyfile(raw_file, staging_file)
+            os.replace(staging_file, cache_file)
+        except OSError:
+            if staging_file is not None:
+                try:
+                    os.unlink(staging_file)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _read_raw_file(raw_file, traces=None, lazy=False):
+        """
+        Open the raw results of a simulation run.
+
+        Binary NGspice raw files are read by LazyRawRead: all traces in a single
+        bulk read, or only the given ones (plus the sweep axis). Anything
+        LazyRawRead can't handle, such as ASCII raw files, is loaded by spicelib's
+        RawRead instead, again all traces or only the given ones.
+
+        Args:
+            raw_file: Path to the raw file
+            traces: Names of the traces that will be used, or None for all
+            lazy: Load binary traces only when they are first used, instead of now;
+                only for files that outlive the results, such as result cache files
+
+        Returns:
+            Raw data object providing get_trace_names() and get_wave()
+        """
+        # Unless the file stays around, load the traces now - per-run raw files go
+        # away with the output folder
+        try:
+            raw_data = LazyRawRead(raw_file, traces=() if traces is not None or lazy else None)
+        except ValueError:
+            if traces is None:
+                return RawRead(raw_file, traces_to_read='*')
+            # Parse the header first to match the wanted names to the file's spelling
+            raw_data = RawRead(raw_file, traces_to_read=None)
+            selected = _select_traces(raw_data.get_trace_names(), traces)
+            for plot in raw_data.plots:
+                plot.read_trace_data(selected)
+            return raw_data
+        
+        if traces is not None:
+            raw_data.load_traces(_select_traces(raw_data.get_trace_names(), traces))
+        return raw_data
+
+    @staticmethod
+    @contextmanager
+    def _output_folder(cleanup_mode, keep_folder=None):
+        """
+        Provide the folder that holds the files of a single simulation run.
+        
+        With cleanup="keep" the files go to the persistent temp_spice_sim/ folder
+        so they can be inspected afterwards. Otherwise every run gets its own
+        temporary directory (in RAM-backed /dev/shm where available, see
+        _scratch_root), which is removed as a whole when the run finishes.
+        
+        Args:
+            cleanup_mode: Temporary file cleanup mode ("silent", "verbose" or "keep")
+            keep_folder: Folder for kept files, or None for the default temp_spice_sim/
+            
+        Yields:
+            str: Path of the output folder
+        """
+        if cleanup_mode == 'keep':
+            output_folder = keep_folder or _keep_folder(os.getcwd())
+            os.makedirs(output_folder, exist_ok=True)
+            print(f"📁 Keeping simulation files in {output_folder}")
+            yield output_folder
+            return
+        
+        with tempfile.TemporaryDirectory(prefix='zest_sim_', dir=_scratch_root()) as output_folder:
             try:
-                if 'netlist_file' in locals() and 'output_folder' in locals():
-                    base_name = os.path.splitext(os.path.basename(netlist_file))[0]
-                    error_details = self._collect_failure_diagnostics(
-                        netlist_file, None, output_folder, base_name
-                    )
-                    raise RuntimeError(f"Simulation failed with exception: {e}\n\n{error_details}")
-                else:
-                    raise RuntimeError(f"Simulation failed with exception: {e}")
-            except Exception:
-                # If diagnostic collection fails, just raise the original error
-                raise RuntimeError(f"Simulation failed with exception: {e}")
-    
-    def _add_analysis_commands(self, netlist: str, analyses: list[str], **kwargs) -> str:
+                yield output_folder
+            finally:
+                if cleanup_mode == 'verbose':
+                    leftover_files = sorted(os.listdir(output_folder))
+                    print(f"🧹 Cleanup: removing {len(leftover_files)} files from {output_folder}:")
+                    for file_name in leftover_files:
+                        print(f"  - {file_name}")
+    
+    def run_op_sweep(self, netlist: str, overlays: list[dict], **kwargs):
+        """
+        Run an operating point analysis for each of a series of element value overlays.
+        
+        When NGspice's shared library is available the netlist is loaded once and
+        every overlay is applied with 'alter' commands (see SweepRunner), so NGspice
+        keeps the parsed circuit between points. Otherwise every overlay is written
+        into its own copy of the netlist and simulated with run().
+        
+        Args:
+            netlist: Complete SPICE netlist string
+            overlays: List of {element_name: value} dicts; all overlays must set the same elements
+            **kwargs: Additional simulation parameters, as for run()
+            
+        Returns:
+            list: One SimulatedCircuit per overlay, in order
+        """
+        kwargs.setdefault('dtype', self.dtype)
+        
+        sweep_runner = SweepRunner(netlist, circuit=kwargs.get('circuit', None),
+                                   dtype=kwargs['dtype'], traces=kwargs.get('traces'))
+        if sweep_runner.available:
+            return sweep_runner.run(overlays)
+        
+        _check_overlays(netlist, overlays)
+        return [self.run(_overlay_netlist(netlist, overlay), ["op"], **kwargs) for overlay in overlays]
+    
+    def run_batch(self, netlists: list[str], analyses: list[str], max_workers=None, **kwargs):
+        """
+        Run the same analyses on several independent netlists in parallel.
+        
+        Every netlist is simulated in its own worker process (each with its own
+        SimRunner and output folder), so a parameter grid scales with the number
+        of CPU cores. The traces are sent back to this process in memory.
+        
+        Netlists found in this backend's in-memory result cache are not simulated
+        again, and new results are added to it. The workers use this backend's
+        keep_folder and cache_dir.
+        
+        Args:
+            netlists: List of complete SPICE netlist strings
+            analyses: List of analysis types, as for run()
+            max_workers: Number of worker processes (default: number of CPUs)
+            **kwargs: Additional simulation parameters, as for run(); 'circuit'
+                is attached to every result but not sent to the workers
+            
+        Returns:
+            list: One SimulatedCircuit per netlist, in order
+        """
+        if not netlists:
+            return []
+        if len(netlists) == 1:
+            # Not worth starting a worker process for
+            return [self.run(netlists[0], analyses, **kwargs)]
+        
+        kwargs.setdefault('dtype', self.dtype)
+        cleanup_mode = kwargs.get('cleanup', 'silent')
+        
+        # Serve what this backend simulated recently from its cache, as run() would
+        keys = [
+            self._memory_key(self._add_analysis_commands(netlist, analyses, **kwargs), kwargs.get('traces'))
+            for netlist in netlists
+        ]
+        raw_data = [self._recall_result(key) if cleanup_mode != 'keep' else None for key in keys]
+        pending = [index for index, data in enumerate(raw_data) if data is None]
+        
+        if len(pending) == 1:
+            raw_data[pending[0]] = self.run(netlists[pending[0]], analyses, **kwargs).raw_data
+        elif pending:
+            settings = {'keep_folder': self.keep_folder, 'cache_dir': self.cache_dir}
+            run_kwargs = {key: value for key, value in kwargs.items() if key != 'circuit'}
+            max_workers = min(max_workers or os.cpu_count() or 4, len(pending))
+            
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    index: executor.submit(_run_batch_item, settings, netlists[index], analyses, run_kwargs)
+                    for index in pending
+                }
+                for index, future in futures.items():
+                    raw_data[index] = _ArrayRawData(future.result())
+                    self._remember_result(keys[index], raw_data[index])
+        
+        return [self._build_result(data, analyses, **kwargs) for data in raw_data]
+    
+    @staticmethod
+    def _add_analysis_commands(netlist: str, analyses: list[str], **kwargs) -> str:
         """
         Add analysis commands to the SPICE netlist.
         
@@ -261,31 +622,14 @@ class SpicelibBackend(SimulatorBackend):
         Returns:
             Modified netlist with analysis commands
         """
-        # Remove existing .end and add analysis commands
-        lines = netlist.rstrip().rstrip('.end').strip().split('\n')
-        
-        for analysis in analyses:
-            if analysis == 'transient':
-                step_time = kwargs.get('step_time', 1e-6)
-                end_time = kwargs.get('end_time', 1e-3)
-                lines.append(f'.tran {step_time} {end_time} UIC')
-            elif analysis == 'ac':
-                start_freq = kwargs.get('start_freq', 1)
-                end_freq = kwargs.get('end_freq', 1e6)
-                points_per_decade = kwargs.get('points_per_decade', 10)
-                lines.append(f'.ac dec {points_per_decade} {start_freq} {end_freq}')
-            elif analysis == 'dc':
-                # DC sweep analysis
-                source = kwargs['source_name']
-                start = kwargs.get('start', 0)
-                stop = kwargs.get('stop', 5)
-                step = kwargs.get('step', 0.1)
-                lines.append(f'.dc {source} {start} {stop} {step}')
-            elif analysis == 'op':
-                lines.append('.op')
-        
-        lines.append('.end')
-        return '\n'.join(lines)
+        # Drop a trailing .end line; the analysis commands go in front of a new one
+        body = netlist.rstrip()
+        last_line_start = body.rfind('\n') + 1
+        if body[last_line_start:].strip().lower() == '.end':
+            body = body[:last_line_start].rstrip()
+        
+        commands = [_ANALYSIS_FORMATTERS[analysis](kwargs) for analysis in analyses if analysis in _ANALYSIS_FORMATTERS]
+        return f"{body}\n" + "\n".join(commands) + "\n.end\n"
     
     def _collect_failure_diagnostics(self, netlist_file, result, output_folder, base_name):
         """
@@ -300,40 +644,35 @@ class SpicelibBackend(SimulatorBackend):
         Returns:
             str: Formatted diagnostic information including file contents
         """
-        import os
-        import glob
-        
         diagnostics = []
         diagnostics.append("=== SIMULATION FAILURE DIAGNOSTICS ===")
         
         # 1. Read netlist file content
-        if os.path.exists(netlist_file):
-            try:
-                with open(netlist_file, 'r') as f:
-                    netlist_content = f.read()
-                diagnostics.append(f"\n--- NETLIST FILE ({netlist_file}) ---")
-                diagnostics.append(netlist_content)
-            except Exception as e:
-                diagnostics.append(f"\n--- NETLIST FILE ({netlist_file}) - READ ERROR ---")
-                diagnostics.append(f"Could not read netlist: {e}")
-        else:
+        try:
+            with open(netlist_file, 'r') as f:
+                netlist_content = f.read()
+            diagnostics.append(f"\n--- NETLIST FILE ({netlist_file}) ---")
+            diagnostics.append(netlist_content)
+        except FileNotFoundError:
             diagnostics.append(f"\n--- NETLIST FILE ---")
             diagnostics.append(f"Netlist file not found: {netlist_file}")
+        except Exception as e:
+            diagnostics.append(f"\n--- NETLIST FILE ({netlist_file}) - READ ERROR ---")
+            diagnostics.append(f"Could not read netlist: {e}")
         
-        # 2. Look for and read log files (common patterns: base_name.log, base_name_1.log, etc.)
-        log_patterns = [
-            os.path.join(output_folder, f"{base_name}.log"),
-            os.path.join(output_folder, f"{base_name}_1.log"),
-            os.path.join(output_folder, f"{base_name}*.log")
-        ]
-        
-        log_files_found = []
-        for pattern in log_patterns:
-            if '*' in pattern:
-                log_files_found.extend(glob.glob(pattern))
-            elif os.path.exists(pattern):
-                log_files_found.append(pattern)
+        # List the related files once (base_name.log, base_name_1.log, ...) and group them by extension
+        related_files = {'.log': [], '.fail': [], '.raw': []}
+        try:
+            with os.scandir(output_folder) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    extension = os.path.splitext(entry.name)[1]
+                    if entry.name.startswith(base_name) and extension in related_files:
+                        related_files[extension].append(entry.path)
+        except OSError:
+            pass
         
+        # 2. Read log files
+        log_files_found = related_files['.log']
         for log_file in log_files_found:
             try:
                 with open(log_file, 'r') as f:
@@ -348,20 +687,8 @@ class SpicelibBackend(SimulatorBackend):
             diagnostics.append(f"\n--- LOG FILES ---")
             diagnostics.append("No log files found")
         
-        # 3. Look for and read .fail files
-        fail_patterns = [
-            os.path.join(output_folder, f"{base_name}.fail"),
-            os.path.join(output_folder, f"{base_name}_1.fail"),
-            os.path.join(output_folder, f"{base_name}*.fail")
-        ]
-        
-        fail_files_found = []
-        for pattern in fail_patterns:
-            if '*' in pattern:
-                fail_files_found.extend(glob.glob(pattern))
-            elif os.path.exists(pattern):
-                fail_files_found.append(pattern)
-        
+        # 3. Read .fail files
+        fail_files_found = related_files['.fail']
         for fail_file in fail_files_found:
             try:
                 with open(fail_file, 'r') as f:
@@ -376,20 +703,8 @@ class SpicelibBackend(SimulatorBackend):
             diagnostics.append(f"\n--- FAIL FILES ---")
             diagnostics.append("No .fail files found")
         
-        # 4. Look for and read raw files (though these are less useful for failed simulations)
-        raw_patterns = [
-            os.path.join(output_folder, f"{base_name}.raw"),
-            os.path.join(output_folder, f"{base_name}_1.raw"),
-            os.path.join(output_folder, f"{base_name}*.raw")
-        ]
-        
-        raw_files_found = []
-        for pattern in raw_patterns:
-            if '*' in pattern:
-                raw_files_found.extend(glob.glob(pattern))
-            elif os.path.exists(pattern):
-                raw_files_found.append(pattern)
-        
+        # 4. Check raw files (though these are less useful for failed simulations)
+        raw_files_found = related_files['.raw']
         for raw_file in raw_files_found:
             try:
                 # Raw files are binary, so just check if they exist and their size
@@ -424,6 +739,322 @@ class SpicelibBackend(SimulatorBackend):
     
 
 
+def _run_batch_item(settings, netlist, analyses, kwargs):
+    """
+    Simulate one netlist of SpicelibBackend.run_batch inside a worker process.
+    
+    Args:
+        settings: keep_folder and cache_dir of the calling backend
+    
+    Returns:
+        dict: Trace name -> numpy array for every trace of the results
+    """
+    # Results go back to the calling backend, which caches them in memory itself
+    backend = SpicelibBackend(result_cache_size=0, **settings)
+    try:
+        result = backend.run(netlist, analyses, **kwargs)
+    except SimulationFailure as failure:
+        # The diagnostics collector can't cross the process boundary; send the rendered report
+        raise SimulationFailure(str(failure)) from None
+    
+    raw_data = result.raw_data
+    trace_names = result.trace_names
+    if hasattr(raw_data, 'read_trace_data'):
+        return raw_data.read_trace_data(trace_names)
+    return {trace_name: np.asarray(raw_data.get_wave(trace_name)) for trace_name in trace_names}
+
+
+def _select_traces(trace_names, wanted):
+    """
+    Filter trace names down to the wanted ones (case-insensitive), keeping the sweep axis.
+    
+    Args:
+        trace_names: Trace names as spelled in the raw file
+        wanted: Names of the traces to keep
+        
+    Returns:
+        list: Kept trace names, in file order
+    """
+    wanted = {name.lower() for name in wanted}
+    return [name for name in trace_names if name.lower() in wanted or _is_axis_trace(name)]
+
+
+def _is_axis_trace(trace_name):
+    """
+    Whether a trace is the time, frequency or sweep axis of the results.
+    
+    NGspice names a DC sweep axis after the swept quantity ('v-sweep', 'i-sweep',
+    'res-sweep', 'temp-sweep'); node and branch traces like 'v(sweep_out)' never match.
+    """
+    lowered = trace_name.lower()
+    return lowered in ('time', 'frequency') or lowered.endswith('-sweep')
+
+
+def _element_lines(netlist):
+    """
+    Map the lowercased names of top-level elements to their line index in the netlist.
+    
+    Elements inside .subckt definitions are skipped; those are instantiated under
+    the name of their X line and can't be overlaid by their own name.
+    """
+    element_lines = {}
+    in_subckt = False
+    for index, line in enumerate(netlist.splitlines()):
+        fields = line.split()
+        if not fields:
+            continue
+        keyword = fields[0].lower()
+        if keyword.startswith('.subckt'):
+            in_subckt = True
+        elif keyword.startswith('.ends'):
+            in_subckt = False
+        elif not in_subckt and keyword[0] not in '.*+':
+            element_lines[keyword] = index
+    return element_lines
+
+
+def _check_overlays(netlist, overlays):
+    """Raise ValueError unless all overlays set the same existing two-terminal elements."""
+    if not overlays:
+        return
+    
+    element_names = {name.lower() for name in overlays[0]}
+    for overlay in overlays:
+        if {name.lower() for name in overlay} != element_names:
+            raise ValueError("All sweep overlays must set the same elements")
+    
+    element_lines = _element_lines(netlist)
+    for name in element_names:
+        if name not in element_lines:
+            raise ValueError(f"Element {name} not found in netlist")
+        if name[0] not in 'rclvi':
+            raise ValueError(f"Element {name} can't be swept: only R, C, L, V and I values can be overlaid")
+
+
+def _overlay_netlist(netlist, overlay):
+    """
+    Return a copy of the netlist with the values of the overlaid elements replaced.
+    
+    Only the value is replaced, as 'alter' would: the rest of the element line (AC
+    specs, transient sources, IC= and other parameters) is kept, so e.g.
+    'V1 N1 gnd DC 5 AC 1' becomes 'V1 N1 gnd DC 3.3 AC 1'. A source without a DC
+    value gets one in front of its other specs.
+    """
+    lines = netlist.splitlines()
+    element_lines = _element_lines(netlist)
+    for name, value in overlay.items():
+        index = element_lines[name.lower()]
+        fields = lines[index].split()
+        if name[0].lower() in 'vi':
+            if len(fields) > 4 and fields[3].lower() == 'dc':
+                fields[4] = str(value)
+            elif len(fields) > 3 and _is_value_field(fields[3]):
+                fields[3] = str(value)
+            else:
+                fields[3:3] = ['DC', str(value)]
+        elif len(fields) > 3:
+            fields[3] = str(value)
+        else:
+            fields.append(str(value))
+        lines[index] = ' '.join(fields)
+    return '\n'.join(lines) + '\n'
+
+
+def _is_value_field(field):
+    """Whether a netlist field is a plain value (number or {expression}) rather than a keyword or source spec."""
+    return field[0] in '{\'' or _VALUE_FIELD.match(field) is not None
+
+
+class SweepRunner:
+    """
+    Runs operating point analyses of one netlist for a series of element value overlays.
+    
+    Instead of writing a netlist and starting an NGspice process per point, the
+    netlist is loaded once into NGspice's shared library (through PySpice) and each
+    overlay is applied with 'alter' commands before the circuit is solved again.
+    NGspice then reuses the parsed circuit and its matrix structure between points,
+    which is much faster for large sweeps where most of the circuit stays the same.
+    
+    Args:
+        netlist: Complete SPICE netlist string
+        circuit: Circuit the netlist was compiled from, passed on to the results
+        dtype: Floating point dtype of the result traces
+        traces: Names of the traces to keep in the results, or None for all of them
+    """
+    
+    def __init__(self, netlist, circuit=None, dtype=np.float64, traces=None):
+        self.netlist = netlist
+        self.circuit = circuit
+        self.dtype = dtype
+        self.traces = traces
+        self._ngspice = None
+        self._unavailable = False
+    
+    @property
+    def available(self):
+        """bool: Whether NGspice's shared library can be used."""
+        return self._get_ngspice() is not None
+    
+    def _get_ngspice(self):
+        """Return the shared NGspice instance, or None if PySpice or libngspice is missing."""
+        if self._ngspice is None and not self._unavailable:
+            try:
+                from PySpice.Spice.NgSpice.Shared import NgSpiceShared
+                self._ngspice = NgSpiceShared.new_instance()
+            except (ImportError, OSError):
+                self._unavailable = True
+        return self._ngspice
+    
+    def run(self, overlays):
+        """
+        Solve the operating point for each overlay.
+        
+        Args:
+            overlays: List of {element_name: value} dicts; all overlays must set the same elements
+            
+        Returns:
+            list: One SimulatedCircuit per overlay, in order
+            
+        Raises:
+            RuntimeError: If NGspice's shared library is not available
+            ValueError: If the overlays are inconsistent or name unknown elements
+            SimulationFailure: If NGspice rejects the circuit or an overlay
+        """
+        ngspice = self._get_ngspice()
+        if ngspice is None:
+            raise RuntimeError("NGspice shared library not available. Install PySpice and libngspice")
+        _check_overlays(self.netlist, overlays)
+        
+        results = []
+        try:
+            ngspice.load_circuit(SpicelibBackend._add_analysis_commands(self.netlist, ["op"]))
+        except Exception as e:
+            raise SimulationFailure(f"Simulation failed: unable to load circuit: {e}", lambda: ngspice.stdout) from e
+        
+        try:
+            for point, overlay in enumerate(overlays):
+                try:
+                    for name, value in overlay.items():
+                        ngspice.exec_command(f"alter {name.lower()} = {value}")
+                    ngspice.run()
+                except Exception as e:
+                    raise SimulationFailure(f"Simulation failed at sweep point {point} ({overlay}): {e}",
+                                            lambda: ngspice.stdout) from e
+                
+                plot_name = ngspice.last_plot
+                traces = self._plot_traces(ngspice.plot(None, plot_name))
+                # Free the vectors of this point before solving the next one
+                ngspice.destroy(plot_name)
+                
+                results.append(SpicelibBackend._build_result(
+                    _ArrayRawData(traces), ["op"], circuit=self.circuit, dtype=self.dtype, traces=self.traces
+                ))
+        finally:
+            ngspice.remove_circuit()
+        
+        return results
+    
+    @staticmethod
+    def _plot_traces(plot):
+        """Convert the vectors of an NGspice plot to arrays named like raw file traces."""
+        traces = {}
+        for vector_name, vector in plot.items():
+            if vector_name.endswith('#branch'):
+                trace_name = f"i({vector_name[:-len('#branch')]})"
+            elif vector_name.startswith('@') or '#' in vector_name:
+                # Internal device parameters and nodes
+                continue
+            else:
+                trace_name = f"v({vector_name})"
+            traces[trace_name] = np.asarray(vector.to_waveform(to_real=True), dtype=np.float64)
+        return traces
+
+
+class _ArrayRawData:
+    """
+    In-memory simulation results with the raw data interface used by SimulatedCircuit.
+    
+    Args:
+        traces: Dict of trace name (e.g. 'v(n1)', 'i(v1)') to numpy array
+    """
+    
+    def __init__(self, traces):
+        self._traces = traces
+    
+    def get_trace_names(self):
+        return list(self._traces)
+    
+    def get_wave(self, trace_name):
+        return self._traces[trace_name]
+
+
+def _as_dtype(data, dtype):
+    """Return real-valued trace data in the given dtype, without copying if it already is."""
+    if isinstance(data, np.ndarray) and data.dtype.kind == 'f' and data.dtype != dtype:
+        return data.astype(dtype)
+    return data
+
+
+class _TraceMap(Mapping):
+    """
+    Read-only mapping from node or branch names to simulation trace data.
+    
+    Only the trace names are known up front; the data of a trace is fetched
+    from the raw results the first time its name is accessed and reused after that.
+    Iterating over all values fetches the remaining traces in a single bulk read.
+    Real-valued traces are converted to the given floating point dtype as they are read.
+    """
+    
+    def __init__(self, raw_data, trace_names, dtype=np.float64):
+        self._raw_data = raw_data
+        self._trace_names = trace_names  # name -> trace name in the raw data
+        self._dtype = np.dtype(dtype)
+        self._data = {}
+    
+    def __getitem__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            trace_name = self._trace_names[name]
+        data = self._data[name] = self._convert(self._raw_data.get_wave(trace_name))
+        return data
+    
+    def _convert(self, data):
+        """Return real-valued trace data in the configured dtype, without copying if it already is."""
+        return _as_dtype(data, self._dtype)
+    
+    def items(self):
+        self._load_all()
+        return super().items()
+    
+    def values(self):
+        self._load_all()
+        return super().values()
+    
+    def _load_all(self):
+        """Fetch every trace not read yet, in one bulk read when the raw data supports it."""
+        missing = [name for name in self._trace_names if name not in self._data]
+        if not missing:
+            return
+        read_trace_data = getattr(self._raw_data, 'read_trace_data', None)
+        if read_trace_data is None:
+            for name in missing:
+                self[name]
+            return
+        data = read_trace_data([self._trace_names[name] for name in missing])
+        for name in missing:
+            self._data[name] = self._convert(data[self._trace_names[name]])
+    
+    def __contains__(self, name):
+        # Membership only needs the names, not the trace data
+        return name in self._trace_names
+    
+    def __iter__(self):
+        return iter(self._trace_names)
+    
+    def __len__(self):
+        return len(self._trace_names)
+
 
 class SimulatedCircuit:
     """
@@ -434,73 +1065,117 @@ class SimulatedCircuit:
     calculated for that component.
     """
     
-    def __init__(self, circuit=None, analysis_type=None, **spicelib_kwargs):
+    def __init__(self, circuit=None, analysis_type=None, dtype=np.float64, *, time=None, raw_data=None, trace_names=None):
         self.circuit = circuit
-        self.analysis_type = analysis_type
+        self.analysis_type = analysis_type  # also sets the is_* flags below
+        
+        # Floating point type of node and branch values; np.float32 halves the memory of long waveforms
+        self.dtype = np.dtype(dtype)
         
         # Store the raw simulation results
-        self.nodes = {}
-        self.branches = {}
-        
-        # SpiceLib initialization
-        if 'time' in spicelib_kwargs:
-            self.time = spicelib_kwargs['time']
-        if 'raw_data' in spicelib_kwargs:
-            self.raw_data = spicelib_kwargs['raw_data']
-        if 'trace_names' in spicelib_kwargs:
-            self.trace_names = spicelib_kwargs['trace_names']
-            # Parse spicelib results to populate nodes and branches dictionaries
+        self._nodes = {}
+        self._branches = {}
+        
+        # Lowercased node/branch name -> key in self.nodes/self.branches, and the
+        # trace holding the DC sweep axis; filled when the traces are parsed
+        self._node_index = {}
+        self._branch_index = {}
+        self._sweep_trace_name = None
+        
+        # SpiceLib results; nodes and branches are parsed from the trace names
+        # the first time they are used
+        self.time = time
+        self.raw_data = raw_data
+        self.trace_names = trace_names
+        self._parse_pending = trace_names is not None
+        
+        # id(component) -> results from get_component_results / get_component_current;
+        # the simulation results never change
+        self._component_result_cache = {}
+        self._component_current_cache = {}
+        
+        # Identities of the simulated components for O(1) membership checks
+        self._components_set = frozenset(map(id, self.circuit.components)) if self.circuit is not None else frozenset()
+    
+    @property
+    def analysis_type(self):
+        """str: Analysis type, e.g. 'Transient Analysis' or 'DC Operating Point'."""
+        return self._analysis_type
+    
+    @analysis_type.setter
+    def analysis_type(self, value):
+        self._analysis_type = value
+        # The is_* predicates are queried per component; compare the strings only once
+        self._is_dc_sweep = value == "DC Sweep"
+        self._is_transient = value == "Transient Analysis"
+        self._is_ac_analysis = value == "AC Analysis"
+        self._is_operating_point = value == "DC Operating Point"
+    
+    @property
+    def nodes(self):
+        """Mapping of node names to voltage traces."""
+        if self._parse_pending:
             self._parse_spicelib_results()
+        return self._nodes
     
-
+    @nodes.setter
+    def nodes(self, value):
+        self._nodes = value
+    
+    @property
+    def branches(self):
+        """Mapping of branch names to current traces."""
+        if self._parse_pending:
+            self._parse_spicelib_results()
+        return self._branches
+    
+    @branches.setter
+    def branches(self, value):
+        self._branches = value
     
     def _parse_spicelib_results(self):
-        """Parse spicelib results and populate nodes and branches dictionaries."""
-        if not hasattr(self, 'raw_data') or not self.raw_data or not hasattr(self, 'trace_names'):
+        """Parse spicelib trace names and populate the nodes and branches mappings."""
+        self._parse_pending = False
+        if not self.raw_data or self.trace_names is None:
             return
         
-        # Extract node voltages and branch currents from spicelib raw data
+        # Sort v(...) and i(...) traces into node and branch names in a single pass;
+        # the trace data itself is only read when a name is first looked up
+        node_traces = {}
+        branch_traces = {}
         for trace_name in self.trace_names:
-            # Look for voltage traces (node voltages)
-            if trace_name.startswith('v(') and trace_name.endswith(')'):
-                # Extract node name from v(node_name) format
-                node_name = trace_name[2:-1]  # Remove 'v(' and ')'
-                try:
-                    trace = self.raw_data.get_trace(trace_name)
-                    if trace and hasattr(trace, 'data'):
-                        self.nodes[node_name] = trace.data
-                except Exception:
-                    # If we can't get the trace, skip it
-                    continue
-            elif trace_name.startswith('V(') and trace_name.endswith(')'):
-                # Handle uppercase version V(node_name)
-                node_name = trace_name[2:-1]  # Remove 'V(' and ')'
-                try:
-                    trace = self.raw_data.get_trace(trace_name)
-                    if trace and hasattr(trace, 'data'):
-                        self.nodes[node_name] = trace.data
-                except Exception:
-                    continue
-            # Look for current traces (branch currents)
-            elif trace_name.startswith('i(') and trace_name.endswith(')'):
-                # Extract component name from i(component_name) format
-                component_name = trace_name[2:-1]  # Remove 'i(' and ')'
-                try:
-                    trace = self.raw_data.get_trace(trace_name)
-                    if trace and hasattr(trace, 'data'):
-                        self.branches[component_name] = trace.data
-                except Exception:
-                    # If we can't get the trace, skip it
-                    continue
-            elif trace_name.startswith('I(') and trace_name.endswith(')'):
-                # Handle uppercase version I(component_name)
-                component_name = trace_name[2:-1]  # Remove 'I(' and ')'
-                try:
-                    trace = self.raw_data.get_trace(trace_name)
-                    if trace and hasattr(trace, 'data'):
-                        self.branches[component_name] = trace.data
-                except Exception:
-                    continue
+            # Node voltage and branch current traces look like 'v(n1)' or 'I(V1)'
+            if len(trace_name) < 4 or trace_name[1] != '(' or trace_name[-1] != ')':
+                continue
+            kind = trace_name[0]
+            if kind in 'vV':
+                node_traces[trace_name[2:-1]] = trace_name
+            elif kind in 'iI':
+                branch_traces[trace_name[2:-1]] = trace_name
+        
+        self.nodes = _TraceMap(self.raw_data, node_traces, self.dtype)
+        self.branches = _TraceMap(self.raw_data, branch_traces, self.dtype)
+        
+        # SPICE names are case-insensitive; index them once so every query is a single dict hit
+        self._node_index = self._lowercase_index(node_traces)
+        self._branch_index = self._lowercase_index(branch_traces)
+        
+        # The sweep axis is a trace of its own (typically 'v-sweep' for voltage sweeps),
+        # not a node voltage; otherwise take the first other '-sweep' axis, e.g. 'i-sweep'
+        trace_index = self._lowercase_index(self.trace_names)
+        self._sweep_trace_name = trace_index.get('v-sweep')
+        if self._sweep_trace_name is None:
+            self._sweep_trace_name = next(
+                (name for lowered, name in trace_index.items() if lowered.endswith('-sweep')), None
+            )
+    
+    @staticmethod
+    def _lowercase_index(names):
+        """Map lowercased names to the names themselves; the first spelling of a name wins."""
+        index = {}
+        for name in names:
+            index.setdefault(name.lower(), name)
+        return index
     
     def get_component_results(self, component):
         """
@@ -510,13 +1185,17 @@ class SimulatedCircuit:
             component: The component instance that was used to build the circuit
             
         Returns:
-            dict: Dictionary containing all available simulation data for this component
+            dict: Dictionary containing all available simulation data for this component.
+                The same dict is returned on every call for a component.
         """
-        if component not in self.circuit.components:
+        if id(component) not in self._components_set:
             raise ValueError(f"Component {component} is not part of this circuit")
         
-        # Delegate to the component to extract its own simulation results
-        return component.extract_simulation_results(self)
+        results = self._component_result_cache.get(id(component))
+        if results is None:
+            # Delegate to the component to extract its own simulation results
+            results = self._component_result_cache[id(component)] = component.extract_simulation_results(self)
+        return results
     
     def _get_node_voltage_value(self, node_name):
         """
@@ -532,12 +1211,11 @@ class SimulatedCircuit:
         if node_name == 'gnd':
             return 0.0
         
-        if hasattr(self, 'raw_data') and self.raw_data and hasattr(self, 'trace_names'):
-            # Use deterministic naming: v(node_name.lower())
-            trace_name = f'v({node_name.lower()})'
-            if trace_name in self.trace_names:
-                trace = self.raw_data.get_trace(trace_name)
-                return trace.data
+        # Use deterministic naming: v(node_name.lower()), resolved through the prebuilt index
+        nodes = self.nodes
+        node_key = self._node_index.get(node_name.lower())
+        if node_key is not None:
+            return nodes[node_key]
                 
         raise ValueError(f"Node {node_name} not found in simulation results")
     
@@ -551,10 +1229,11 @@ class SimulatedCircuit:
         Returns:
             float or array or None: The current value(s) or None if not found
         """
-        # Use deterministic naming: component_name.lower()
-        if branch_name in self.branches:
-            branch_value = self.branches[branch_name]
-            return self._extract_value(branch_value)
+        # Use deterministic naming: component_name.lower(), resolved through the prebuilt index
+        branches = self.branches
+        branch_key = self._branch_index.get(branch_name.lower())
+        if branch_key is not None:
+            return self._extract_value(branches[branch_key])
         
         # No match found
         return None
@@ -576,15 +1255,21 @@ class SimulatedCircuit:
         if self.circuit is None:
             raise ValueError("Cannot get component current without circuit reference")
         
-        if component not in self.circuit.components:
+        if id(component) not in self._components_set:
             raise ValueError(f"Component {component} is not part of this circuit")
         
+        # Whichever source provided the current before, it is still the answer
+        current_value = self._component_current_cache.get(id(component))
+        if current_value is not None:
+            return current_value
+        
         # First try to get SPICE current (for active components)
         component_name = self.circuit.get_component_name(component)
         branch_name = component_name.lower()
         
         current_value = self._get_branch_current_value(branch_name)
         if current_value is not None:
+            self._component_current_cache[id(component)] = current_value
             return current_value
         
         # Fall back to calculated current from component's derived results
@@ -592,7 +1277,8 @@ class SimulatedCircuit:
         try:
             component_results = self.get_component_results(component)
             if 'current' in component_results:
-                return component_results['current']
+                current_value = self._component_current_cache[id(component)] = component_results['current']
+                return current_value
         except Exception:
             pass
         
@@ -615,23 +1301,34 @@ class SimulatedCircuit:
             raise ValueError("Cannot get terminal current without circuit reference")
         
         # Find which component this terminal belongs to
-        for component in self.circuit.components:
-            for terminal_name, comp_terminal in component.get_terminals():
-                if comp_terminal is terminal:
-                    return self.get_component_current(component)
+        component = self.circuit._find_terminal_owner(terminal)
+        if component is None:
+            raise ValueError(f"Terminal {terminal} not found in any circuit component")
         
-        raise ValueError(f"Terminal {terminal} not found in any circuit component")
+        return self.get_component_current(component)
     
     def _extract_value(self, node_value):
         """Extract numeric value from SpiceLib simulation data."""
-        # Handle numpy arrays from SpiceLib
+        # Fast path: numpy arrays, the usual trace type, are dispatched on type alone
+        if isinstance(node_value, np.ndarray):
+            # For DC analysis, return scalar if single value
+            if node_value.size == 1:
+                return float(node_value.flat[0])
+            # Multiple values - traces already in the result dtype are returned without copying
+            if node_value.dtype == self.dtype:
+                return node_value
+            return node_value.astype(self.dtype)
+        # Plain scalars (e.g. the 0.0 of ground) skip the attribute probes below
+        if isinstance(node_value, (int, float, np.integer, np.floating)):
+            return float(node_value)
+        # Handle other array types
         if hasattr(node_value, 'shape') and hasattr(node_value, '__getitem__'):
             # For DC analysis, return scalar if single value
             if len(node_value) == 1:
                 return float(node_value[0])
             else:
                 # Multiple values - return as numpy array for transient/AC analysis
-                return np.array(node_value, dtype=float)
+                return np.asarray(node_value, dtype=self.dtype)
         elif hasattr(node_value, '__float__'):
             return float(node_value)
         elif hasattr(node_value, '__iter__') and not isinstance(node_value, str):
@@ -659,6 +1356,85 @@ class SimulatedCircuit:
         node_name = self.circuit.get_spice_node_name(terminal)
         return self._get_node_voltage_value(node_name)
     
+    def get_node_voltages(self, terminals):
+        """
+        Get the voltages at several terminals/nodes as one array.
+        
+        Args:
+            terminals: Sequence of Terminal objects or gnd
+            
+        Returns:
+            numpy.ndarray: Array with one row of voltage values per terminal
+        """
+        if self.circuit is None:
+            raise ValueError("Cannot get node voltage without circuit reference")
+        
+        rows = [self._get_node_voltage_value(self.circuit.get_spice_node_name(terminal)) for terminal in terminals]
+        
+        # Fill a single preallocated array; ground rows broadcast from the scalar 0.0.
+        # Complex AC rows make the whole array complex; real rows keep the result dtype
+        voltages = np.empty(
+            (len(rows), max((np.size(row) for row in rows), default=0)),
+            dtype=np.result_type(*rows, self.dtype),
+        )
+        for index, row in enumerate(rows):
+            voltages[index] = row
+        return voltages
+    
+    def to_numpy_dict(self, traces=None):
+        """
+        Export simulation traces as numpy arrays in one bulk read.
+        
+        Prefer this over querying nodes one at a time when post-processing many traces.
+        
+        Args:
+            traces: Names of the traces to export, e.g. ['time', 'v(n1)'] (case-insensitive);
+                None exports all traces
+            
+        Returns:
+            dict: Trace name -> numpy array, in the requested (or file) order
+            
+        Raises:
+            KeyError: If one of the traces is not part of the results
+        """
+        if self.raw_data is None or self.trace_names is None:
+            return {}
+        
+        if traces is None:
+            names = list(self.trace_names)
+        else:
+            index = self._lowercase_index(self.trace_names)
+            names = []
+            for trace in traces:
+                if trace.lower() not in index:
+                    raise KeyError(f"No trace named '{trace}' in the simulation results")
+                names.append(index[trace.lower()])
+        
+        read_trace_data = getattr(self.raw_data, 'read_trace_data', None)
+        if read_trace_data is not None:
+            data = read_trace_data(names)
+        else:
+            data = {name: np.asarray(self.raw_data.get_wave(name)) for name in names}
+        # The axis keeps its precision (float32 can't resolve fine time steps), as self.time does
+        return {name: data[name] if _is_axis_trace(name) else _as_dtype(data[name], self.dtype) for name in names}
+    
+    def to_dataframe(self, traces=None):
+        """
+        Export simulation traces as a pandas DataFrame with one column per trace.
+        
+        Args:
+            traces: Names of the traces to export (see to_numpy_dict); None exports all traces
+            
+        Returns:
+            pandas.DataFrame: One row per simulation point
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError("pandas not installed. Run: pip install pandas")
+        
+        return pd.DataFrame(self.to_numpy_dict(traces), copy=False)
+    
     def list_components(self):
         """List all components in the circuit."""
         return [(comp, self.circuit.get_component_name(comp)) for comp in self.circuit.components]
@@ -673,10 +1449,10 @@ class SimulatedCircuit:
         Returns:
             numpy.ndarray: Time values, or None if not transient analysis
         """
-        if self.analysis_type != "Transient Analysis":
+        if not self._is_transient:
             return None
         
-        return getattr(self, 'time', None)
+        return self.time
     
     def get_sweep_variable(self):
         """
@@ -685,37 +1461,31 @@ class SimulatedCircuit:
         Returns:
             numpy.ndarray: Sweep variable values, or None if not DC sweep analysis
         """
-        if self.analysis_type != "DC Sweep":
+        if not self._is_dc_sweep:
             return None
         
-        # Look for the sweep variable (typically 'v-sweep' for voltage sweeps)
-        sweep_candidates = ['v-sweep', 'V-SWEEP']
-        for candidate in sweep_candidates:
-            if candidate in self.nodes:
-                return self._extract_value(self.nodes[candidate])
-        
-        # If not found, look for any trace with 'sweep' in the name
-        for node_name, node_data in self.nodes.items():
-            if 'sweep' in node_name.lower():
-                return self._extract_value(node_data)
-        
-        return None
+        # The sweep trace is located once when the trace names are parsed
+        if self._parse_pending:
+            self._parse_spicelib_results()
+        if self._sweep_trace_name is None:
+            return None
+        return self._extract_value(self.raw_data.get_wave(self._sweep_trace_name))
     
     def is_dc_sweep(self):
         """Check if this is a DC sweep analysis."""
-        return self.analysis_type == "DC Sweep"
+        return self._is_dc_sweep
     
     def is_transient(self):
         """Check if this is a transient analysis."""
-        return self.analysis_type == "Transient Analysis"
+        return self._is_transient
     
     def is_ac_analysis(self):
         """Check if this is an AC analysis."""
-        return self.analysis_type == "AC Analysis"
+        return self._is_ac_analysis
     
     def is_operating_point(self):
         """Check if this is a DC operating point analysis."""
-        return self.analysis_type == "DC Operating Point"
+        return self._is_operating_point
 
 
 class CircuitSimulator:
@@ -776,11 +1546,8 @@ class CircuitSimulator:
 
 def check_simulation_requirements():
     """Check if simulation requirements are available."""
-    try:
-        from spicelib import SimRunner
-        from spicelib.simulators.ngspice_simulator import NGspiceSimulator
+    if _SPICELIB_AVAILABLE:
         return True, "Simulation requirements satisfied (spicelib available)"
-    except ImportError:
-        return False, "spicelib is not installed. Install with: pip install spicelib"
+    return False, "spicelib is not installed. Install with: pip install spicelib"
     
     # Could add more checks here (ngspice installation, etc.) 
\ No newline at end of file